@@ -8,10 +8,11 @@ system health for the AI News Automation System.
 import asyncio
 import time
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Set, Tuple
+from array import array
+from datetime import timedelta
+from typing import List, Dict, Any, Optional, Tuple
 from uuid import UUID, uuid4
-from collections import defaultdict, deque
+from collections import deque
 from dataclasses import dataclass
 
 from pydantic_ai import Agent, RunContext
@@ -29,6 +30,7 @@ from agents.content_analysis.agent import get_content_analysis_service
 from agents.report_generation.agent import get_report_generation_service
 from agents.alert.agent import get_alert_service
 from utils.cost_tracking import CostTracker, ServiceType
+from utils.time_utils import NANOSECONDS_PER_SECOND, ns_to_utc_datetime
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -165,6 +167,14 @@ Always provide clear reasoning for task sequencing, resource allocation, and ris
 )
 
 
+# Compact integer codes for task statuses used by the scheduler's packed
+# dependency arrays. -1 marks a task the scheduler has not seen yet.
+TASK_STATUS_CODES: Dict[TaskStatus, int] = {
+    status: code for code, status in enumerate(TaskStatus)
+}
+UNKNOWN_STATUS_CODE = -1
+
+
 class TaskScheduler:
     """Task scheduling and queue management."""
     
@@ -173,63 +183,141 @@ class TaskScheduler:
         self.running_tasks: Dict[UUID, Task] = {}
         self.completed_tasks: Dict[UUID, Task] = {}
         self.failed_tasks: Dict[UUID, Task] = {}
-        self.task_dependencies: Dict[UUID, Set[UUID]] = defaultdict(set)
+        
+        # Dense task indices and their current status codes
+        self.task_index: Dict[UUID, int] = {}
+        self.status_codes = array('b')
+        
+        # Per slot: owning task and how many unfinished tasks' dependencies
+        # point at it. Slots of finished, unreferenced tasks are reused.
+        self.slot_task_ids: List[Optional[UUID]] = []
+        self.slot_refs = array('q')
+        self.free_slots: List[int] = []
+        
+        # Flat (dep_task_idx, required_status_code, ...) pairs per task
+        self.packed_dependencies: Dict[UUID, array] = {}
+    
+    def _get_task_index(self, task_id: UUID) -> int:
+        """Get dense index for a task, allocating (or reusing) one if needed."""
+        index = self.task_index.get(task_id)
+        if index is None:
+            # A task finished earlier may have had its slot reclaimed; restore its status
+            finished = self.completed_tasks.get(task_id) or self.failed_tasks.get(task_id)
+            status_code = TASK_STATUS_CODES[finished.status] if finished else UNKNOWN_STATUS_CODE
+            
+            if self.free_slots:
+                index = self.free_slots.pop()
+                self.slot_task_ids[index] = task_id
+                self.status_codes[index] = status_code
+                self.slot_refs[index] = 0
+            else:
+                index = len(self.status_codes)
+                self.slot_task_ids.append(task_id)
+                self.status_codes.append(status_code)
+                self.slot_refs.append(0)
+            self.task_index[task_id] = index
+        return index
+    
+    def _release_slot(self, index: int):
+        """Reclaim a slot once its task has finished and no dependency refers to it."""
+        task_id = self.slot_task_ids[index]
+        if task_id is None or self.slot_refs[index]:
+            return
+        if task_id not in self.completed_tasks and task_id not in self.failed_tasks:
+            return
+        del self.task_index[task_id]
+        self.slot_task_ids[index] = None
+        self.status_codes[index] = UNKNOWN_STATUS_CODE
+        self.free_slots.append(index)
+    
+    def _retire_task(self, task: Task):
+        """Drop a finished task's packed dependencies and reclaim what is no longer referenced."""
+        packed = self.packed_dependencies.pop(task.task_id, None)
+        if packed:
+            for i in range(0, len(packed), 2):
+                dep_index = packed[i]
+                self.slot_refs[dep_index] -= 1
+                self._release_slot(dep_index)
+        self._release_slot(self.task_index[task.task_id])
+    
+    def _set_status(self, task: Task, status: TaskStatus):
+        """Update task status and its packed status code."""
+        task.status = status
+        self.status_codes[self._get_task_index(task.task_id)] = TASK_STATUS_CODES[status]
         
     def add_task(self, task: Task):
         """Add task to queue."""
         self.task_queue.append(task)
-        
-        # Update dependency mapping
-        for dep in task.dependencies:
-            self.task_dependencies[task.task_id].add(dep.task_id)
+        self.status_codes[self._get_task_index(task.task_id)] = TASK_STATUS_CODES[task.status]
+        
+        # Pack dependencies once at submission
+        if task.dependencies:
+            packed = array('q')
+            for dep in task.dependencies:
+                dep_index = self._get_task_index(dep.task_id)
+                self.slot_refs[dep_index] += 1
+                packed.append(dep_index)
+                packed.append(TASK_STATUS_CODES[dep.required_status])
+            self.packed_dependencies[task.task_id] = packed
+    
+    def dependencies_satisfied(self, task: Task) -> bool:
+        """Check packed dependencies against current status codes."""
+        packed = self.packed_dependencies.get(task.task_id)
+        if not packed:
+            return True
+        
+        status_codes = self.status_codes
+        return all(
+            status_codes[packed[i]] == packed[i + 1]
+            for i in range(0, len(packed), 2)
+        )
     
     def get_ready_tasks(self) -> List[Task]:
         """Get tasks that are ready to run."""
         ready_tasks = []
+        now = ns_to_utc_datetime(time.time_ns())
         
         for task in list(self.task_queue):
-            if task.is_ready_to_run:
-                # Check if all dependencies are satisfied
-                dependencies = self.task_dependencies.get(task.task_id, set())
-                dependencies_satisfied = all(
-                    dep_id in self.completed_tasks for dep_id in dependencies
-                )
-                
-                if dependencies_satisfied:
-                    ready_tasks.append(task)
-                    self.task_queue.remove(task)
+            if task.is_ready_at(now) and self.dependencies_satisfied(task):
+                ready_tasks.append(task)
+                self.task_queue.remove(task)
         
         # Sort by priority and scheduled time
         ready_tasks.sort(key=lambda t: (
             t.priority.value,
-            t.scheduled_for or datetime.utcnow()
+            t.scheduled_for or now
         ))
         
         return ready_tasks
     
     def mark_task_running(self, task: Task):
         """Mark task as running."""
-        task.status = TaskStatus.RUNNING
-        task.started_at = datetime.utcnow()
+        self._set_status(task, TaskStatus.RUNNING)
+        task.started_ts_ns = time.time_ns()
+        task.started_at = ns_to_utc_datetime(task.started_ts_ns)
         self.running_tasks[task.task_id] = task
     
     def mark_task_completed(self, task: Task, result: Dict[str, Any]):
         """Mark task as completed."""
-        task.status = TaskStatus.COMPLETED
-        task.completed_at = datetime.utcnow()
+        self._set_status(task, TaskStatus.COMPLETED)
+        completed_ts_ns = time.time_ns()
+        task.completed_at = ns_to_utc_datetime(completed_ts_ns)
         task.result = result
-        task.actual_duration_seconds = (task.completed_at - task.started_at).total_seconds()
+        task.actual_duration_seconds = (completed_ts_ns - task.started_ts_ns) / NANOSECONDS_PER_SECOND
+        task.actual_cost_usd = float(result.get("cost_usd", 0.0))
         
         if task.task_id in self.running_tasks:
             del self.running_tasks[task.task_id]
         
         self.completed_tasks[task.task_id] = task
+        self._retire_task(task)
     
     def mark_task_failed(self, task: Task, error_message: str):
         """Mark task as failed."""
-        task.status = TaskStatus.FAILED
+        self._set_status(task, TaskStatus.FAILED)
         task.error_message = error_message
-        task.completed_at = datetime.utcnow()
+        failed_at = ns_to_utc_datetime(time.time_ns())
+        task.completed_at = failed_at
         
         if task.task_id in self.running_tasks:
             del self.running_tasks[task.task_id]
@@ -237,18 +325,19 @@ class TaskScheduler:
         # Check if retry is needed
         if task.retry_count < task.max_retries:
             task.retry_count += 1
-            task.status = TaskStatus.RETRYING
-            task.last_retry_at = datetime.utcnow()
+            self._set_status(task, TaskStatus.RETRYING)
+            task.last_retry_at = failed_at
             
             # Add back to queue with delay
             retry_delay = task.retry_delay_seconds
             if task.exponential_backoff:
                 retry_delay *= (2 ** task.retry_count)
             
-            task.scheduled_for = datetime.utcnow() + timedelta(seconds=retry_delay)
+            task.scheduled_for = failed_at + timedelta(seconds=retry_delay)
             self.task_queue.append(task)
         else:
             self.failed_tasks[task.task_id] = task
+            self._retire_task(task)
 
 
 class CoordinationService:
@@ -272,7 +361,7 @@ class CoordinationService:
         # System monitoring
         self.system_metrics = SystemMetrics()
         self.health_check_interval = 60  # seconds
-        self.last_health_check = datetime.utcnow()
+        self.last_health_check = ns_to_utc_datetime(time.time_ns())
         
         # Workflow templates
         self.workflow_templates = self._load_workflow_templates()
@@ -407,7 +496,7 @@ class CoordinationService:
             task_ids=[task.task_id for task in tasks],
             scheduled_tasks=len(tasks),
             immediate_tasks=len(tasks) if request.immediate_execution else 0,
-            estimated_completion_time=datetime.utcnow() + timedelta(
+            estimated_completion_time=ns_to_utc_datetime(time.time_ns()) + timedelta(
                 minutes=coordination_plan.estimated_duration_minutes
             ),
             estimated_total_cost_usd=sum(
@@ -540,7 +629,7 @@ Create an optimal execution plan considering dependencies, resource constraints,
     
     async def _update_system_metrics(self):
         """Update current system metrics."""
-        current_time = datetime.utcnow()
+        current_time = ns_to_utc_datetime(time.time_ns())
         
         # Update task counts
         self.system_metrics.total_tasks_pending = len(self.scheduler.task_queue)
@@ -602,9 +691,9 @@ Create an optimal execution plan considering dependencies, resource constraints,
                     await self._execute_task(task)
                 
                 # Health check if needed
-                if (datetime.utcnow() - self.last_health_check).total_seconds() > self.health_check_interval:
+                if (ns_to_utc_datetime(time.time_ns()) - self.last_health_check).total_seconds() > self.health_check_interval:
                     await self._perform_health_check()
-                    self.last_health_check = datetime.utcnow()
+                    self.last_health_check = ns_to_utc_datetime(time.time_ns())
                 
                 # Update system metrics
                 await self._update_system_metrics()
@@ -646,30 +735,30 @@ Create an optimal execution plan considering dependencies, resource constraints,
             if task_type == TaskType.NEWS_DISCOVERY:
                 # Route to news discovery agent
                 from agents.news_discovery.models import NewsDiscoveryRequest
-                request = NewsDiscoveryRequest(**task.parameters)
+                request = NewsDiscoveryRequest.model_validate(task.parameters)
                 response = await self.agent_services["news_discovery"].discover_news(request)
-                return {"success": response.success, "data": response}
+                return {"success": response.success, "data": response, "cost_usd": response.cost_usd}
             
             elif task_type == TaskType.CONTENT_ANALYSIS:
                 # Route to content analysis agent
                 from agents.content_analysis.models import AnalysisRequest
-                request = AnalysisRequest(**task.parameters)
+                request = AnalysisRequest.model_validate(task.parameters)
                 response = await self.agent_services["content_analysis"].analyze_content(request)
-                return {"success": response.success, "data": response}
+                return {"success": response.success, "data": response, "cost_usd": response.analysis_cost}
             
             elif task_type == TaskType.REPORT_GENERATION:
                 # Route to report generation agent
                 from agents.report_generation.models import ReportGenerationRequest
-                request = ReportGenerationRequest(**task.parameters)
+                request = ReportGenerationRequest.model_validate(task.parameters)
                 response = await self.agent_services["report_generation"].generate_report(request)
-                return {"success": response.success, "data": response}
+                return {"success": response.success, "data": response, "cost_usd": response.generation_cost}
             
             elif task_type == TaskType.ALERT_EVALUATION:
                 # Route to alert agent
                 from agents.alert.models import AlertRequest
-                request = AlertRequest(**task.parameters)
+                request = AlertRequest.model_validate(task.parameters)
                 response = await self.agent_services["alert"].evaluate_alert(request)
-                return {"success": response.success, "data": response}
+                return {"success": response.success, "data": response, "cost_usd": response.evaluation_cost}
             
             else:
                 return {"success": False, "error": f"Unknown task type: {task_type}"}
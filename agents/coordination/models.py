@@ -6,11 +6,13 @@ and system health monitoring.
 """
 
 from typing import List, Optional, Dict, Any, Union, Set
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+import time
 from enum import Enum
 from uuid import UUID, uuid4
-from pydantic import BaseModel, Field, validator
-import json
+from pydantic import BaseModel, Field, PrivateAttr, validator
+
+from utils.time_utils import NANOSECONDS_PER_SECOND, ns_to_utc_datetime
 
 
 class TaskStatus(str, Enum):
@@ -63,6 +65,13 @@ class SystemHealth(str, Enum):
     DOWN = "down"
 
 
+def _utc_timestamp(value: datetime) -> float:
+    """POSIX timestamp for a datetime, treating naive values as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
 class TaskDependency(BaseModel):
     """Dependency relationship between tasks."""
     task_id: UUID = Field(..., description="ID of the dependent task")
@@ -80,6 +89,11 @@ class TaskResource(BaseModel):
     requires_internet: bool = Field(default=True)
     api_calls_estimated: int = Field(default=1, ge=0)
     estimated_cost_usd: float = Field(default=0.01, ge=0.0)
+    
+    @property
+    def estimated_duration_ns(self) -> int:
+        """Estimated execution time in integer nanoseconds."""
+        return self.estimated_duration_seconds * NANOSECONDS_PER_SECOND
 
 
 class Task(BaseModel):
@@ -110,6 +124,7 @@ class Task(BaseModel):
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     last_retry_at: Optional[datetime] = None
+    started_ts_ns: int = Field(default=0, ge=0, exclude=True, description="Start time in epoch nanoseconds")
     
     # Results and errors
     result: Optional[Dict[str, Any]] = Field(None, description="Task result data")
@@ -131,18 +146,26 @@ class Task(BaseModel):
     @property
     def is_overdue(self) -> bool:
         """Check if task is overdue."""
+        return self.is_overdue_at(datetime.utcnow())
+    
+    def is_overdue_at(self, now: datetime) -> bool:
+        """Check if task is overdue at a given time."""
         if not self.deadline:
             return False
-        return datetime.utcnow() > self.deadline and self.status not in [TaskStatus.COMPLETED, TaskStatus.CANCELLED]
+        return now > self.deadline and self.status not in (TaskStatus.COMPLETED, TaskStatus.CANCELLED)
     
     @property
     def is_ready_to_run(self) -> bool:
         """Check if all dependencies are satisfied."""
+        return self.is_ready_at(datetime.utcnow())
+    
+    def is_ready_at(self, now: datetime) -> bool:
+        """Check readiness at a given time, so loops can share one clock read."""
         if self.status != TaskStatus.PENDING:
             return False
         
         # Check if scheduled time has arrived
-        if self.scheduled_for and datetime.utcnow() < self.scheduled_for:
+        if self.scheduled_for and now < self.scheduled_for:
             return False
         
         # All dependencies must be satisfied
@@ -154,9 +177,11 @@ class Task(BaseModel):
         if self.status == TaskStatus.COMPLETED:
             return self.completed_at
         
+        if self.status == TaskStatus.RUNNING and self.started_ts_ns:
+            return ns_to_utc_datetime(self.started_ts_ns + self.resource_requirements.estimated_duration_ns)
+        
         if self.status == TaskStatus.RUNNING and self.started_at:
-            estimated_end = self.started_at + timedelta(seconds=self.resource_requirements.estimated_duration_seconds)
-            return estimated_end
+            return self.started_at + timedelta(seconds=self.resource_requirements.estimated_duration_seconds)
         
         if self.scheduled_for:
             return self.scheduled_for + timedelta(seconds=self.resource_requirements.estimated_duration_seconds)
@@ -198,13 +223,23 @@ class AgentInfo(BaseModel):
             self.current_task_count < self.max_concurrent_tasks
         )
     
+    _last_heartbeat_ts: float = PrivateAttr(default=0.0)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Cache the heartbeat as a POSIX timestamp."""
+        self._last_heartbeat_ts = _utc_timestamp(self.last_heartbeat)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "last_heartbeat":
+            self._last_heartbeat_ts = _utc_timestamp(value)
+    
     @property
     def is_healthy(self) -> bool:
         """Check if agent is healthy."""
-        heartbeat_age = datetime.utcnow() - self.last_heartbeat
         return (
-            self.status in [AgentStatus.ONLINE, AgentStatus.BUSY] and
-            heartbeat_age.total_seconds() < 300 and  # 5 minutes
+            self.status in (AgentStatus.ONLINE, AgentStatus.BUSY) and
+            time.time() - self._last_heartbeat_ts < 300.0 and  # 5 minutes
             self.error_count_last_hour < 10
         )
 
@@ -272,19 +307,22 @@ class SystemMetrics(BaseModel):
     @property
     def overall_health(self) -> SystemHealth:
         """Determine overall system health."""
-        # Critical conditions
-        if self.agents_online == 0:
+        agents_online = self.agents_online
+        if not agents_online:
             return SystemHealth.DOWN
         
-        if self.error_rate_last_hour > 0.5 or self.critical_errors_last_hour > 10:
+        error_rate = self.error_rate_last_hour
+        
+        # Critical conditions
+        if error_rate > 0.5 or self.critical_errors_last_hour > 10:
             return SystemHealth.CRITICAL
         
-        # Warning conditions
+        # Warning conditions (agents_error > 20% of online agents, in ints)
         if (
-            self.error_rate_last_hour > 0.1 or
+            error_rate > 0.1 or
             self.avg_queue_wait_time_seconds > 300 or  # 5 minutes
             self.avg_cpu_usage_percent > 80 or
-            self.agents_error > self.agents_online * 0.2
+            self.agents_error * 5 > agents_online
         ):
             return SystemHealth.WARNING
         
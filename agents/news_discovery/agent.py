@@ -6,13 +6,15 @@ and initial relevance scoring for AI news content.
 """
 
 import asyncio
-import json
 import time
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 from uuid import uuid4
 import logging
 
+import orjson
+
 from pydantic_ai import Agent, RunContext
 from pydantic_ai.models import Model
 from pydantic import BaseModel, Field
@@ -20,24 +22,34 @@ from pydantic import BaseModel, Field
 from config.settings import get_settings
 from .models import (
     NewsDiscoveryRequest, NewsDiscoveryResponse, DiscoverySession,
-    RSSFeedSource, ProcessedArticle, RawArticle, FeedProcessingResult,
-    FeedStatus, ArticleStatus
+    RSSFeedSource, ProcessedArticle, RawArticleRecord, FeedProcessingResult,
+    FeedStatus, ArticleStatus, get_seen_filter
+)
+from .tools import (
+    AgePartitionedBloomFilter, AsyncTokenBucket, KeywordMatcher, MinHashLSH, count_tokens_batch,
+    parse_published_date
 )
 from mcp_servers.rss_aggregator import RSSAggregator, FeedFetchRequest
 from database.models import NewsSource, NewsArticle
-from utils.cost_tracking import CostTracker
+from utils.cost_tracking import CostTracker, ServiceType
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Delay between feed chunks during discovery
+FEED_CHUNK_DELAY_SECONDS = 0.25
+
 
 class DiscoveryDeps(BaseModel):
     """Dependencies for the News Discovery Agent."""
+    model_config = {"arbitrary_types_allowed": True}
+    
     rss_aggregator: RSSAggregator
     cost_tracker: CostTracker
     settings: Any  # Settings object
     session_id: str = Field(default_factory=lambda: str(uuid4()))
+    dedup_index: Optional[MinHashLSH] = None  # Near-duplicate index, may be pre-seeded
+    rate_limiter: Optional[AsyncTokenBucket] = None  # Shared LLM request budget
+    seen_filter: Optional[AgePartitionedBloomFilter] = None  # Content fingerprints across runs
 
 
 class RelevanceAssessment(BaseModel):
@@ -91,23 +103,32 @@ Always provide clear reasoning for relevance scores and identify key topics/enti
 )
 
 
+def _time_context_for_hour(hour: int) -> str:
+    """Describe the discovery focus for an hour of the day."""
+    if 5 <= hour <= 9:
+        return "Morning discovery session - prioritize overnight developments and breaking news."
+    elif 12 <= hour <= 14:
+        return "Midday discovery - focus on regular content updates and analysis pieces."
+    elif 18 <= hour <= 20:
+        return "Evening discovery - capture end-of-day announcements and market close analysis."
+    return "Off-hours discovery - maintain standard processing with quality focus."
+
+
+# Time-of-day context indexed by hour, built once at import
+TIME_CONTEXTS: Tuple[str, ...] = tuple(_time_context_for_hour(hour) for hour in range(24))
+
+
+@lru_cache(maxsize=8)
+def _cost_context(daily_cost_limit: float) -> str:
+    """Format the budget line of the dynamic prompt."""
+    return f"Daily budget remaining: ${daily_cost_limit:.2f}. Optimize for cost-effectiveness."
+
+
 @news_discovery_agent.system_prompt
 async def get_dynamic_prompt(ctx: RunContext[DiscoveryDeps]) -> str:
     """Generate dynamic system prompt based on current context."""
-    settings = ctx.deps.settings
-    current_hour = datetime.now().hour
-    
-    # Adjust behavior based on time of day
-    if 5 <= current_hour <= 9:
-        time_context = "Morning discovery session - prioritize overnight developments and breaking news."
-    elif 12 <= current_hour <= 14:
-        time_context = "Midday discovery - focus on regular content updates and analysis pieces."
-    elif 18 <= current_hour <= 20:
-        time_context = "Evening discovery - capture end-of-day announcements and market close analysis."
-    else:
-        time_context = "Off-hours discovery - maintain standard processing with quality focus."
-    
-    cost_context = f"Daily budget remaining: ${settings.daily_cost_limit:.2f}. Optimize for cost-effectiveness."
+    time_context = TIME_CONTEXTS[datetime.now().hour]
+    cost_context = _cost_context(ctx.deps.settings.daily_cost_limit)
     
     return f"""
 Current context: {time_context}
@@ -131,47 +152,114 @@ async def discover_news(request: NewsDiscoveryRequest, deps: DiscoveryDeps) -> N
     
     start_time = time.time()
     total_cost = 0.0
+    workers: List[asyncio.Task] = []
     
     try:
-        logger.info(f"Starting news discovery session {session.session_id}")
+        logger.info("Starting news discovery session %s", session.session_id)
         session.status = FeedStatus.FETCHING
         
-        # Process feeds concurrently
-        feed_tasks = []
-        semaphore = asyncio.Semaphore(request.session_config.max_sources_concurrent)
+        config = request.session_config
+        if deps.dedup_index is None:
+            deps.dedup_index = MinHashLSH(threshold=config.similarity_threshold)
         
-        for feed_source in request.session_config.feed_sources:
-            if not feed_source.enabled:
-                continue
-                
-            task = asyncio.create_task(
-                _process_single_feed(feed_source, request.session_config, deps, semaphore)
+        # The fingerprint window outlives this session, so dedup spans runs
+        if deps.seen_filter is None:
+            deps.seen_filter = get_seen_filter(config.max_total_articles, config.content_hash_window_hours)
+        session.use_seen_filter(deps.seen_filter)
+        
+        # One request budget shared by all workers; idle time allows a short burst
+        if deps.rate_limiter is None:
+            deps.rate_limiter = AsyncTokenBucket(
+                rate=1.0 / config.delay_between_requests,
+                capacity=config.max_concurrent_assessments
             )
-            feed_tasks.append(task)
         
-        # Wait for all feeds to complete
-        feed_results = await asyncio.gather(*feed_tasks, return_exceptions=True)
+        # Without the Batch API, articles stream to concurrent assessment
+        # workers as soon as their feed is deduplicated
+        loop = asyncio.get_running_loop()
+        assessment_queue: Optional[asyncio.Queue] = None
+        assessed: Dict[int, Tuple[RelevanceAssessment, float]] = {}
+        if not config.use_batch_api:
+            assessment_queue = asyncio.Queue()
+            workers = [
+                asyncio.create_task(_assessment_worker(assessment_queue, config, deps, assessed))
+                for _ in range(config.max_concurrent_assessments)
+            ]
+        
+        # Process feeds concurrently in fixed-size chunks
+        enabled_feeds = [f for f in config.feed_sources if f.enabled]
+        chunk_size = config.max_sources_concurrent
+        feed_results = []
+        
+        for chunk_start in range(0, len(enabled_feeds), chunk_size):
+            chunk = enabled_feeds[chunk_start:chunk_start + chunk_size]
+            feed_results.extend(await asyncio.gather(
+                *(_process_single_feed(feed_source, config, deps, assessment_queue, session) for feed_source in chunk),
+                return_exceptions=True
+            ))
+            
+            # Brief pause between chunks to be polite to feed servers
+            if chunk_start + chunk_size < len(enabled_feeds):
+                await asyncio.sleep(FEED_CHUNK_DELAY_SECONDS)
         
         # Process results and handle exceptions
         successful_results = []
-        for i, result in enumerate(feed_results):
-            if isinstance(result, Exception):
-                logger.error(f"Feed processing failed: {result}")
-                session.errors.append(f"Feed {request.session_config.feed_sources[i].name}: {str(result)}")
+        pending_assessment: List[Tuple[FeedProcessingResult, List[RawArticleRecord]]] = []
+        for i, outcome in enumerate(feed_results):
+            if isinstance(outcome, Exception):
+                logger.error("Feed processing failed: %s", outcome)
+                session.errors.append(f"Feed {enabled_feeds[i].name}: {str(outcome)}")
             else:
+                result, raw_articles = outcome
                 successful_results.append(result)
                 session.feed_results.append(result)
+                pending_assessment.append((result, raw_articles))
         
         session.status = FeedStatus.PROCESSING
         
-        # Aggregate metrics
-        session.total_articles_discovered = sum(r.articles_found for r in successful_results)
-        session.total_articles_processed = sum(r.articles_processed for r in successful_results)
-        session.total_articles_relevant = sum(
-            len([a for a in r.processed_articles if a.relevance_score >= request.session_config.min_relevance_score])
-            for r in successful_results
-        )
-        session.total_duplicates_filtered = sum(r.articles_duplicates for r in successful_results)
+        all_articles = [article for _, raw_articles in pending_assessment for article in raw_articles]
+        if assessment_queue is not None:
+            # Let workers drain the queue, then stop them
+            for _ in workers:
+                assessment_queue.put_nowait(None)
+            await asyncio.gather(*workers)
+            
+            assessments = []
+            assessment_times = []
+            for article in all_articles:
+                assessment, assessment_time = assessed.get(id(article)) or (_fallback_relevance_assessment(article), 0.0)
+                assessments.append(assessment)
+                assessment_times.append(assessment_time)
+        else:
+            # Assess all new articles from every feed in one batch
+            batch_start = loop.time()
+            assessments = await _assess_articles_batch(all_articles, config, deps)
+            per_article = (loop.time() - batch_start) / max(len(all_articles), 1)
+            assessment_times = [per_article] * len(all_articles)
+        
+        assessed_at = datetime.utcnow()
+        
+        offset = 0
+        for result, raw_articles in pending_assessment:
+            end = offset + len(raw_articles)
+            _apply_assessments(
+                result, raw_articles, assessments[offset:end], assessment_times[offset:end],
+                assessed_at, config.min_relevance_score, config.trust_feed_data, session
+            )
+            offset = end
+        
+        # Aggregate metrics in a single pass over feed results
+        discovered = processed = relevant = duplicates = 0
+        for r in successful_results:
+            discovered += r.articles_found
+            processed += r.articles_processed
+            relevant += r.articles_relevant
+            duplicates += r.articles_duplicates
+        
+        session.total_articles_discovered = discovered
+        session.total_articles_processed = processed
+        session.total_articles_relevant = relevant
+        session.total_duplicates_filtered = duplicates
         
         # Calculate performance metrics
         session.total_processing_time = time.time() - start_time
@@ -189,7 +277,7 @@ async def discover_news(request: NewsDiscoveryRequest, deps: DiscoveryDeps) -> N
         # Calculate next run time
         next_run = _calculate_next_run_time(session, request.session_config)
         
-        logger.info(f"Discovery session completed: {session.total_articles_relevant} relevant articles found")
+        logger.info("Discovery session completed: %d relevant articles found", session.total_articles_relevant)
         
         return NewsDiscoveryResponse(
             success=True,
@@ -204,7 +292,9 @@ async def discover_news(request: NewsDiscoveryRequest, deps: DiscoveryDeps) -> N
         )
         
     except Exception as e:
-        logger.error(f"News discovery session failed: {e}")
+        logger.error("News discovery session failed: %s", e)
+        for worker in workers:
+            worker.cancel()
         session.status = FeedStatus.FAILED
         session.errors.append(str(e))
         
@@ -224,119 +314,193 @@ async def _process_single_feed(
     feed_source: RSSFeedSource, 
     config: Any, 
     deps: DiscoveryDeps,
-    semaphore: asyncio.Semaphore
-) -> FeedProcessingResult:
-    """Process a single RSS feed."""
-    async with semaphore:
-        start_time = time.time()
-        result = FeedProcessingResult(
-            feed_source=feed_source,
-            status=FeedStatus.FETCHING,
-            started_at=datetime.utcnow()
+    assessment_queue: Optional[asyncio.Queue] = None,
+    session: Optional[DiscoverySession] = None
+) -> Tuple[FeedProcessingResult, List[RawArticleRecord]]:
+    """
+    Fetch a single RSS feed and return its new, non-duplicate articles.
+    
+    When an assessment queue is given, the new articles are also queued
+    for assessment together with their prompts and token counts. When a
+    session is given, exact content fingerprints already seen in its
+    dedup window are dropped before near-duplicate checks.
+    """
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+    result = FeedProcessingResult(
+        feed_source=feed_source,
+        status=FeedStatus.FETCHING
+    )
+    raw_articles: List[RawArticleRecord] = []
+    
+    try:
+        # Fetch RSS feed
+        fetch_request = FeedFetchRequest(
+            feed_url=feed_source.url,
+            max_articles=config.max_articles_per_source,
+            timeout=config.request_timeout
         )
         
+        # Import and use the MCP tool directly
+        from mcp_servers.rss_aggregator import fetch_rss_feed
+        rss_result = await fetch_rss_feed(fetch_request)
+        
+        if rss_result.error:
+            result.status = FeedStatus.FAILED
+            result.errors.append(rss_result.error)
+            return result, raw_articles
+        
+        result.articles_found = len(rss_result.articles)
+        result.fetch_time = rss_result.fetch_time
+        result.status = FeedStatus.PROCESSING
+        
+        # Drop stale items before any per-article work
+        recent_articles = _filter_recent_articles(rss_result.articles, config.max_article_age_hours)
+        result.articles_stale = result.articles_found - len(recent_articles)
+        
+        # Build and deduplicate each article; assessment happens later
+        feed_name = feed_source.name
+        feed_category = feed_source.category
+        for article_data, published_date in recent_articles:
+            try:
+                # Cheap checks here; full validation happens once in _apply_assessments
+                title = (article_data.get('title') or '').strip()
+                if not title:
+                    raise ValueError("Article title cannot be empty")
+                
+                raw_article = RawArticleRecord(
+                    title=title,
+                    url=article_data['url'],
+                    published_date=published_date,
+                    feed_source=feed_name,
+                    feed_category=feed_category,
+                    description=article_data.get('summary', ''),
+                    content=article_data.get('content', ''),
+                    author=article_data.get('author', ''),
+                    tags=article_data.get('tags', [])
+                )
+                
+                # Cheap fingerprint check first, then near-duplicates seen earlier in the session
+                is_duplicate = (
+                    (session is not None and session.seen(raw_article.simhash))
+                    or await _check_duplicate(raw_article, deps)
+                )
+                
+                if is_duplicate:
+                    result.articles_duplicates += 1
+                    continue
+                
+                raw_articles.append(raw_article)
+                
+            except Exception as e:
+                logger.warning("Error processing article %s: %s", article_data.get('title', 'Unknown'), e)
+                result.articles_errors += 1
+                continue
+        
+        result.articles_new = len(raw_articles)
+        
+        if assessment_queue is not None and raw_articles:
+            prompts = [_build_assessment_prompt(article) for article in raw_articles]
+            for item in zip(raw_articles, prompts, count_tokens_batch(prompts)):
+                assessment_queue.put_nowait(item)
+        
+        result.processing_time = loop.time() - start_time
+        
+        return result, raw_articles
+        
+    except Exception as e:
+        logger.error("Failed to process feed %s: %s", feed_source.name, e)
+        result.status = FeedStatus.FAILED
+        result.errors.append(str(e))
+        result.processing_time = loop.time() - start_time
+        return result, []
+
+
+def _filter_recent_articles(
+    articles: List[Dict[str, Any]],
+    max_age_hours: int
+) -> List[Tuple[Dict[str, Any], datetime]]:
+    """
+    Keep feed items published within the age limit, paired with their parsed date.
+    
+    Dates are parsed once here and reused when building the article record.
+    Items without a date count as new, and naive dates are treated as UTC.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
+    recent = []
+    for article_data in articles:
+        published_date = parse_published_date(article_data.get('published_date'))
+        compared = published_date if published_date.tzinfo else published_date.replace(tzinfo=timezone.utc)
+        if compared >= cutoff:
+            recent.append((article_data, published_date))
+    return recent
+
+
+def _apply_assessments(
+    result: FeedProcessingResult,
+    raw_articles: List[RawArticleRecord],
+    assessments: List[RelevanceAssessment],
+    assessment_times: List[float],
+    completed_at: datetime,
+    min_relevance_score: float,
+    trusted: bool = False,
+    session: Optional[DiscoverySession] = None
+) -> None:
+    """
+    Attach relevance assessments to a feed result as processed articles.
+    
+    When a session is given, each processed article is also offered to its
+    bounded top-relevance heap.
+    """
+    if result.status == FeedStatus.FAILED:
+        return
+    
+    for raw_article, assessment, assessment_time in zip(raw_articles, assessments, assessment_times):
         try:
-            # Fetch RSS feed
-            fetch_request = FeedFetchRequest(
-                feed_url=feed_source.url,
-                max_articles=config.max_articles_per_source,
-                timeout=config.request_timeout
+            processed_article = ProcessedArticle(
+                raw_article=raw_article.to_raw_article(trusted),
+                status=ArticleStatus.PROCESSED,
+                relevance_score=assessment.relevance_score,
+                quality_score=assessment.quality_score,
+                extracted_entities={
+                    'topics': assessment.key_topics,
+                    'entities': assessment.entities
+                },
+                processing_time=assessment_time,
+                processing_cost=0.01  # Estimated cost per analysis
             )
             
-            # Import and use the MCP tool directly
-            from mcp_servers.rss_aggregator import fetch_rss_feed
-            rss_result = await fetch_rss_feed(fetch_request)
-            
-            if rss_result.error:
-                result.status = FeedStatus.FAILED
-                result.errors.append(rss_result.error)
-                return result
-            
-            result.articles_found = len(rss_result.articles)
-            result.fetch_time = rss_result.fetch_time
-            result.status = FeedStatus.PROCESSING
-            
-            # Process each article
-            processed_articles = []
-            for article_data in rss_result.articles:
-                try:
-                    raw_article = RawArticle(
-                        title=article_data['title'],
-                        url=article_data['url'],
-                        description=article_data.get('summary', ''),
-                        content=article_data.get('content', ''),
-                        author=article_data.get('author', ''),
-                        published_date=datetime.fromisoformat(article_data['published_date']) if article_data.get('published_date') else datetime.now(timezone.utc),
-                        feed_source=feed_source.name,
-                        feed_category=feed_source.category,
-                        tags=article_data.get('tags', [])
-                    )
-                    
-                    # Check for duplicates (simplified - would use database in production)
-                    is_duplicate = await _check_duplicate(raw_article, deps)
-                    
-                    if is_duplicate:
-                        result.articles_duplicates += 1
-                        continue
-                    
-                    # Assess relevance using AI
-                    assessment = await _assess_article_relevance(raw_article, deps)
-                    
-                    processed_article = ProcessedArticle(
-                        raw_article=raw_article,
-                        status=ArticleStatus.PROCESSED,
-                        relevance_score=assessment.relevance_score,
-                        quality_score=assessment.quality_score,
-                        extracted_entities={
-                            'topics': assessment.key_topics,
-                            'entities': assessment.entities
-                        },
-                        processing_time=time.time() - start_time,
-                        processing_cost=0.01  # Estimated cost per analysis
-                    )
-                    
-                    processed_articles.append(processed_article)
-                    result.articles_processed += 1
-                    
-                    # Rate limiting
-                    await asyncio.sleep(config.delay_between_requests)
-                    
-                except Exception as e:
-                    logger.warning(f"Error processing article {article_data.get('title', 'Unknown')}: {e}")
-                    result.articles_errors += 1
-                    continue
-            
-            result.processed_articles = processed_articles
-            result.status = FeedStatus.COMPLETED
-            result.completed_at = datetime.utcnow()
-            result.processing_time = time.time() - start_time
-            
-            logger.info(f"Processed feed {feed_source.name}: {result.articles_processed}/{result.articles_found} articles")
-            
-            return result
+            result.add_processed_article(processed_article)
+            result.articles_processed += 1
+            result.articles_relevant += assessment.relevance_score >= min_relevance_score
+            if session is not None:
+                session.offer_article(processed_article)
             
         except Exception as e:
-            logger.error(f"Failed to process feed {feed_source.name}: {e}")
-            result.status = FeedStatus.FAILED
-            result.errors.append(str(e))
-            result.processing_time = time.time() - start_time
-            return result
+            logger.warning("Error processing article %s: %s", raw_article.title, e)
+            result.articles_errors += 1
+    
+    result.status = FeedStatus.COMPLETED
+    result.completed_at = completed_at
+    
+    logger.info(
+        "Processed feed %s: %d/%d articles",
+        result.feed_source.name, result.articles_processed, result.articles_found
+    )
+
 
+async def _check_duplicate(article: RawArticleRecord, deps: DiscoveryDeps) -> bool:
+    """Check if article is a duplicate of one already seen this session."""
+    if deps.dedup_index is None:
+        return False
+    
+    text = f"{article.title} {article.description or ''}"
+    return deps.dedup_index.check_and_insert(str(article.url), text)
 
-async def _check_duplicate(article: RawArticle, deps: DiscoveryDeps) -> bool:
-    """Check if article is a duplicate."""
-    # Simplified duplicate check - would use database and content similarity in production
-    return False
 
+ASSESSMENT_MODEL = 'gpt-5-mini'
 
-async def _assess_article_relevance(article: RawArticle, deps: DiscoveryDeps) -> RelevanceAssessment:
-    """Use AI to assess article relevance and quality."""
-    
-    # Create assessment agent
-    assessment_agent = Agent(
-        'openai:gpt-5-mini',
-        result_type=RelevanceAssessment,
-        system_prompt="""You are an AI content evaluator specialized in assessing news articles for relevance to AI industry professionals.
+ASSESSMENT_SYSTEM_PROMPT = """You are an AI content evaluator specialized in assessing news articles for relevance to AI industry professionals.
 
 Evaluate articles based on:
 
@@ -362,9 +526,23 @@ URGENCY (1-5):
 - 1: General educational or background content
 
 Always provide clear reasoning for your assessment."""
-    )
-    
-    # Prepare article content for evaluation
+
+# Routes every assessment request to the same provider-side prompt cache;
+# bump the version whenever ASSESSMENT_SYSTEM_PROMPT changes
+ASSESSMENT_PROMPT_CACHE_KEY = "ai_news_assess_v1"
+
+# Assessment agent is built once and reused for every article. The system
+# prompt is the leading message of every request, so OpenAI prefix caching
+# applies to it after the first call.
+assessment_agent = Agent(
+    f'openai:{ASSESSMENT_MODEL}',
+    result_type=RelevanceAssessment,
+    system_prompt=ASSESSMENT_SYSTEM_PROMPT
+)
+
+
+def _build_assessment_prompt(article: RawArticleRecord) -> str:
+    """Build the user prompt for assessing a single article."""
     content_summary = f"""
 Title: {article.title}
 Description: {article.description or 'N/A'}
@@ -374,18 +552,168 @@ Published: {article.published_date}
 Content Preview: {(article.content or article.description or '')[:500]}...
 Tags: {', '.join(article.tags) if article.tags else 'None'}
 """
+    return f"Assess this AI news article for relevance and quality:\n\n{content_summary}"
+
+
+async def _assessment_worker(
+    queue: asyncio.Queue,
+    config: Any,
+    deps: DiscoveryDeps,
+    assessed: Dict[int, Tuple[RelevanceAssessment, float]]
+) -> None:
+    """
+    Assess queued articles until a None sentinel is received.
+    
+    Results are stored in ``assessed`` keyed by ``id(article)`` together with
+    the seconds spent on the assessment.
+    """
+    loop = asyncio.get_running_loop()
+    
+    while True:
+        item = await queue.get()
+        if item is None:
+            return
+        
+        article, prompt, input_tokens = item
+        async with deps.rate_limiter:
+            assess_start = loop.time()
+            assessment = await _assess_article_relevance(article, deps, prompt, input_tokens)
+            assessed[id(article)] = (assessment, loop.time() - assess_start)
+
+
+async def _assess_articles_batch(
+    articles: List[RawArticleRecord],
+    config: Any,
+    deps: DiscoveryDeps
+) -> List[RelevanceAssessment]:
+    """
+    Assess articles through the OpenAI Batch API.
+    
+    Submits one request per article in a single batch, polls until it
+    finishes, and maps results back by custom_id. Articles without a usable
+    result fall back to keyword assessment.
+    """
+    if not articles:
+        return []
+    
+    assessments: List[Optional[RelevanceAssessment]] = [None] * len(articles)
+    response_format = {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "relevance_assessment",
+            "schema": RelevanceAssessment.model_json_schema()
+        }
+    }
     
     try:
-        # Get AI assessment
-        assessment = await assessment_agent.run(
-            f"Assess this AI news article for relevance and quality:\n\n{content_summary}"
+        from openai import AsyncOpenAI
+        client = AsyncOpenAI(api_key=deps.settings.openai_api_key.get_secret_value())
+        
+        request_lines = [
+            orjson.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": ASSESSMENT_MODEL,
+                    "messages": [
+                        {"role": "system", "content": ASSESSMENT_SYSTEM_PROMPT},
+                        {"role": "user", "content": _build_assessment_prompt(article)}
+                    ],
+                    "response_format": response_format,
+                    "prompt_cache_key": ASSESSMENT_PROMPT_CACHE_KEY
+                }
+            })
+            for i, article in enumerate(articles)
+        ]
+        
+        batch_file = await client.files.create(
+            file=("relevance_assessments.jsonl", b"\n".join(request_lines)),
+            purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
         )
+        logger.info("Submitted assessment batch %s with %d articles", batch.id, len(articles))
+        
+        # Poll until the batch reaches a terminal state or we time out
+        deadline = time.monotonic() + config.batch_timeout_seconds
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            if time.monotonic() >= deadline:
+                logger.warning("Assessment batch %s timed out, cancelling", batch.id)
+                await client.batches.cancel(batch.id)
+                break
+            await asyncio.sleep(config.batch_poll_interval)
+            batch = await client.batches.retrieve(batch.id)
+        
+        if batch.status == "completed" and batch.output_file_id:
+            output = await client.files.content(batch.output_file_id)
+            for line in output.content.splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    record = orjson.loads(line)
+                    body = record["response"]["body"]
+                    index = int(record["custom_id"])
+                    assessments[index] = RelevanceAssessment.model_validate_json(
+                        body["choices"][0]["message"]["content"]
+                    )
+                    
+                    usage = body.get("usage", {})
+                    deps.cost_tracker.track_operation(
+                        operation="relevance_assessment_batch",
+                        service=ServiceType.OPENAI,
+                        model=ASSESSMENT_MODEL,
+                        input_tokens=usage.get("prompt_tokens", 0),
+                        output_tokens=usage.get("completion_tokens", 0),
+                        cost_usd=0.005,  # Batch API is billed at half the on-demand rate
+                        cached_tokens=(usage.get("prompt_tokens_details") or {}).get("cached_tokens", 0)
+                    )
+                except Exception as e:
+                    logger.warning("Unusable batch result line: %s", e)
+        else:
+            logger.warning("Assessment batch %s ended with status %s", batch.id, batch.status)
+    
+    except Exception as e:
+        logger.warning("Batch assessment failed, using keyword fallback: %s", e)
+    
+    return [
+        assessment if assessment is not None else _fallback_relevance_assessment(article)
+        for article, assessment in zip(articles, assessments)
+    ]
+
+
+@lru_cache(maxsize=1)
+def _system_prompt_tokens() -> int:
+    """Token count of the assessment system prompt, computed once."""
+    return count_tokens_batch([ASSESSMENT_SYSTEM_PROMPT])[0]
+
+
+async def _assess_article_relevance(
+    article: RawArticleRecord,
+    deps: DiscoveryDeps,
+    prompt: Optional[str] = None,
+    input_tokens: Optional[int] = None
+) -> RelevanceAssessment:
+    """Use AI to assess article relevance and quality."""
+    # Prepare article content for evaluation
+    if prompt is None:
+        prompt = _build_assessment_prompt(article)
+    if input_tokens is None:
+        input_tokens = count_tokens_batch([prompt])[0]
+    
+    try:
+        # Get AI assessment
+        assessment = await assessment_agent.run(prompt)
         
         # Track cost
         deps.cost_tracker.track_operation(
-            operation_type="relevance_assessment",
-            model="gpt-5-mini",
-            input_tokens=len(content_summary.split()) * 1.3,  # Rough estimate
+            operation="relevance_assessment",
+            service=ServiceType.OPENAI,
+            model=ASSESSMENT_MODEL,
+            input_tokens=_system_prompt_tokens() + input_tokens,
             output_tokens=50,  # Approximate
             cost_usd=0.01
         )
@@ -393,40 +721,48 @@ Tags: {', '.join(article.tags) if article.tags else 'None'}
         return assessment.data
         
     except Exception as e:
-        logger.warning(f"AI assessment failed for article {article.title}: {e}")
+        logger.warning("AI assessment failed for article %s: %s", article.title, e)
         
         # Fallback assessment based on keywords
         return _fallback_relevance_assessment(article)
 
 
-def _fallback_relevance_assessment(article: RawArticle) -> RelevanceAssessment:
+# AI-related keywords with weights for fallback assessment
+FALLBACK_AI_KEYWORDS: Dict[str, float] = {
+    'artificial intelligence': 0.9, 'ai': 0.8, 'machine learning': 0.85, 'deep learning': 0.85,
+    'neural network': 0.8, 'transformer': 0.8, 'gpt': 0.9, 'llm': 0.9, 'large language model': 0.9,
+    'openai': 0.85, 'google ai': 0.8, 'deepmind': 0.85, 'anthropic': 0.85,
+    'computer vision': 0.75, 'natural language': 0.75, 'nlp': 0.75,
+    'generative ai': 0.9, 'chatgpt': 0.85, 'claude': 0.8, 'gemini': 0.8
+}
+
+BREAKING_NEWS_WORDS = ['breaking', 'announces', 'launches', 'releases']
+
+# One matcher covers both keyword sets so content is scanned once
+_fallback_matcher = KeywordMatcher(list(FALLBACK_AI_KEYWORDS) + BREAKING_NEWS_WORDS)
+_AI_KEYWORD_BITS = [(keyword, _fallback_matcher.bits[keyword]) for keyword in FALLBACK_AI_KEYWORDS]
+BREAKING_NEWS_MASK = _fallback_matcher.mask_for(BREAKING_NEWS_WORDS)
+
+
+def _fallback_relevance_assessment(article: RawArticleRecord) -> RelevanceAssessment:
     """Fallback relevance assessment using keyword matching."""
     content = f"{article.title} {article.description or ''} {article.content or ''}".lower()
+    content_length = len(content)
     
-    # AI-related keywords with weights
-    ai_keywords = {
-        'artificial intelligence': 0.9, 'ai': 0.8, 'machine learning': 0.85, 'deep learning': 0.85,
-        'neural network': 0.8, 'transformer': 0.8, 'gpt': 0.9, 'llm': 0.9, 'large language model': 0.9,
-        'openai': 0.85, 'google ai': 0.8, 'deepmind': 0.85, 'anthropic': 0.85,
-        'computer vision': 0.75, 'natural language': 0.75, 'nlp': 0.75,
-        'generative ai': 0.9, 'chatgpt': 0.85, 'claude': 0.8, 'gemini': 0.8
-    }
-    
-    relevance_score = 0.0
     quality_score = 0.5  # Default
-    key_topics = []
     entities = []
     
+    # Single scan for AI keywords and breaking-news words
+    hit_mask = _fallback_matcher.find_mask(content)
+    
     # Calculate relevance based on keyword presence
-    for keyword, weight in ai_keywords.items():
-        if keyword in content:
-            relevance_score = max(relevance_score, weight)
-            key_topics.append(keyword)
+    key_topics = [keyword for keyword, bit in _AI_KEYWORD_BITS if hit_mask & bit]
+    relevance_score = max((FALLBACK_AI_KEYWORDS[k] for k in key_topics), default=0.0)
     
     # Adjust quality based on source and content length
     if article.feed_category in ['AI Research', 'Academic Research']:
         quality_score += 0.2
-    if len(content) > 1000:
+    if content_length > 1000:
         quality_score += 0.1
     if article.author:
         quality_score += 0.1
@@ -434,8 +770,8 @@ def _fallback_relevance_assessment(article: RawArticle) -> RelevanceAssessment:
     quality_score = min(1.0, quality_score)
     
     # Determine urgency (simplified)
-    is_breaking = any(word in content for word in ['breaking', 'announces', 'launches', 'releases'])
-    urgency = 3 if is_breaking else 2
+    is_breaking = (hit_mask & BREAKING_NEWS_MASK) != 0
+    urgency = 2 + is_breaking
     
     return RelevanceAssessment(
         relevance_score=relevance_score,
@@ -476,24 +812,27 @@ def _generate_recommendations(session: DiscoverySession, results: List[FeedProce
     return recommendations or ["All systems operating optimally"]
 
 
+# Next-run policy: base interval of one hour, scaled by success rate
+# (<70%, normal, >90%) and by relevant articles found (<10, normal, >50)
+NEXT_RUN_BASE_SECONDS = 3600
+NEXT_RUN_SUCCESS_FACTORS = (1.2, 1.0, 0.9)  # Back off when failing, speed up when healthy
+NEXT_RUN_RELEVANCE_FACTORS = (1.1, 1.0, 0.95)  # Back off when quiet, speed up when busy
+
+_NEXT_RUN_TABLE = tuple(
+    tuple(
+        timedelta(seconds=int(int(NEXT_RUN_BASE_SECONDS * success_factor) * relevance_factor))
+        for relevance_factor in NEXT_RUN_RELEVANCE_FACTORS
+    )
+    for success_factor in NEXT_RUN_SUCCESS_FACTORS
+)
+
+
 def _calculate_next_run_time(session: DiscoverySession, config: Any) -> datetime:
     """Calculate recommended next run time."""
-    # Base interval (1 hour default)
-    base_interval = 3600
-    
-    # Adjust based on success rate
-    if session.success_rate > 90:
-        base_interval = int(base_interval * 0.9)  # Run more frequently if successful
-    elif session.success_rate < 70:
-        base_interval = int(base_interval * 1.2)  # Run less frequently if having issues
-    
-    # Adjust based on article discovery rate
-    if session.total_articles_relevant < 10:
-        base_interval = int(base_interval * 1.1)  # Run less frequently if not finding much
-    elif session.total_articles_relevant > 50:
-        base_interval = int(base_interval * 0.95)  # Run more frequently if finding lots
+    success_bucket = (session.success_rate > 90) - (session.success_rate < 70)
+    relevance_bucket = (session.total_articles_relevant > 50) - (session.total_articles_relevant < 10)
     
-    return datetime.utcnow() + timedelta(seconds=base_interval)
+    return datetime.utcnow() + _NEXT_RUN_TABLE[success_bucket + 1][relevance_bucket + 1]
 
 
 # Agent wrapper function for external use
@@ -516,7 +855,7 @@ async def run_news_discovery(request: NewsDiscoveryRequest) -> NewsDiscoveryResp
         return response
         
     except Exception as e:
-        logger.error(f"News discovery failed: {e}")
+        logger.error("News discovery failed: %s", e)
         raise
     
     finally:
@@ -5,12 +5,59 @@ Defines Pydantic models for RSS feed processing, article discovery,
 and deduplication operations.
 """
 
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from uuid import UUID
-from pydantic import BaseModel, Field, HttpUrl, validator
-import hashlib
+from array import array
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+import heapq
+import sys
+import time
+from pydantic import (
+    BaseModel, ConfigDict, Field, HttpUrl, PrivateAttr, TypeAdapter, computed_field, field_validator,
+    model_validator
+)
+
+from utils.time_utils import ns_to_utc_datetime
+
+from .tools import (
+    AgePartitionedBloomFilter, SIMHASH_MAX_DISTANCE, parse_published_date, simhash64, simhash_distance
+)
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_DATETIME = TypeAdapter(datetime)
+
+
+def utc_datetime_to_ns(value: datetime) -> int:
+    """Convert a datetime to integer epoch nanoseconds; naive values are UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def timestamp_to_ns(data: Any, name: str) -> Any:
+    """
+    Map an incoming `name` timestamp onto its `name_ns` field.
+
+    Dumped models carry the computed datetime, not the excluded ns field, so
+    this lets model_validate(model.model_dump()) and JSON round trips keep
+    the original time instead of defaulting to now.
+    """
+    if isinstance(data, dict) and name in data:
+        data = dict(data)
+        value = data.pop(name)
+        if value is not None and f"{name}_ns" not in data:
+            data[f"{name}_ns"] = utc_datetime_to_ns(_DATETIME.validate_python(value))
+    return data
+
+
+# Article URL validation: plain ASCII http(s) URLs skip full HttpUrl parsing
+MAX_URL_LENGTH = 2000
+_URL_PREFIXES = ('http://', 'https://')
+_HTTP_URL = TypeAdapter(HttpUrl)
 
 
 class FeedStatus(str, Enum):
@@ -52,18 +99,15 @@ class RSSFeedSource(BaseModel):
     avg_fetch_time: float = Field(default=0.0, description="Average fetch time in seconds")
     total_articles_found: int = Field(default=0, description="Total articles discovered")
     relevant_articles_found: int = Field(default=0, description="Articles above relevance threshold")
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class RawArticle(BaseModel):
     """Raw article data from RSS feed."""
+    # Frozen so the cached fingerprint and word count can never go stale
+    model_config = ConfigDict(frozen=True)
     
     title: str = Field(..., description="Article title")
-    url: HttpUrl = Field(..., description="Article URL")
+    url: str = Field(..., description="Article URL")
     description: Optional[str] = Field(None, description="Article summary/description")
     content: Optional[str] = Field(None, description="Full article content")
     author: Optional[str] = Field(None, description="Article author")
@@ -76,35 +120,163 @@ class RawArticle(BaseModel):
     tags: List[str] = Field(default_factory=list, description="Article tags")
     
     # Processing metadata
-    discovered_at: datetime = Field(default_factory=datetime.utcnow)
+    discovered_at_ns: int = Field(default_factory=time.time_ns, exclude=True, description="Discovery time, epoch ns")
     raw_content: Optional[str] = Field(None, description="Raw HTML content")
     
-    @validator('title')
+    @computed_field
+    @property
+    def discovered_at(self) -> datetime:
+        """Discovery time as a naive UTC datetime."""
+        return ns_to_utc_datetime(self.discovered_at_ns)
+    
+    @model_validator(mode='before')
+    @classmethod
+    def restore_discovered_at(cls, data: Any) -> Any:
+        """Accept a dumped discovered_at datetime."""
+        return timestamp_to_ns(data, "discovered_at")
+    
+    @classmethod
+    def from_feed_row(
+        cls,
+        row: Dict[str, Any],
+        feed_source: str,
+        feed_category: str,
+        *,
+        trusted: bool = False
+    ) -> "RawArticle":
+        """
+        Build an article from an RSS aggregator row.
+        
+        Untrusted rows are fully validated. Trusted rows come from our own
+        aggregator and skip validation; see construct_trusted.
+        """
+        fields = {
+            'title': (row.get('title') or '').strip(),
+            'url': row['url'],
+            'description': row.get('summary', ''),
+            'content': row.get('content', ''),
+            'author': row.get('author', ''),
+            'published_date': parse_published_date(row.get('published_date')),
+            'feed_source': feed_source,
+            'feed_category': feed_category,
+            'guid': row.get('guid') or None,
+            'tags': row.get('tags', [])
+        }
+        if trusted:
+            return cls.construct_trusted(**fields)
+        return cls(**fields)
+    
+    @classmethod
+    def construct_trusted(cls, **fields: Any) -> "RawArticle":
+        """
+        Build an article without field validation.
+        
+        Keeps the empty-title check and label interning; the URL is stored
+        as given rather than parsed into HttpUrl.
+        """
+        title = fields.get('title')
+        if not title or not title.strip():
+            raise ValueError("Article title cannot be empty")
+        fields['title'] = title.strip()
+        fields['feed_source'] = sys.intern(fields['feed_source'])
+        fields['feed_category'] = sys.intern(fields['feed_category'])
+        fields['tags'] = [sys.intern(tag) for tag in fields.get('tags', ())]
+        return cls.model_construct(**fields)
+    
+    @field_validator('title')
     def title_not_empty(cls, v):
         """Ensure title is not empty."""
-        if not v or not v.strip():
+        if v[:1].isspace() or v[-1:].isspace():
+            v = v.strip()
+        if not v:
             raise ValueError("Article title cannot be empty")
-        return v.strip()
+        return v
     
-    @validator('url')
+    @field_validator('feed_source', 'feed_category')
+    def intern_feed_label(cls, v):
+        """Share one string per feed name and category across articles."""
+        return sys.intern(v)
+    
+    @field_validator('tags')
+    def intern_tags(cls, v):
+        """Share one string per distinct tag across articles."""
+        return [sys.intern(tag) for tag in v]
+    
+    @field_validator('url', mode='before')
     def url_reachable(cls, v):
-        """Basic URL validation."""
+        """Basic URL validation; only unusual URLs go through HttpUrl parsing."""
         url_str = str(v)
-        if len(url_str) > 2000:
+        if len(url_str) > MAX_URL_LENGTH:
             raise ValueError("URL too long")
-        return v
+        if url_str.startswith(_URL_PREFIXES) and url_str.isascii() and ' ' not in url_str:
+            return url_str
+        return str(_HTTP_URL.validate_python(url_str))
     
-    @property
+    @cached_property
+    def url_obj(self) -> HttpUrl:
+        """The URL parsed as HttpUrl, built on first access."""
+        return _HTTP_URL.validate_python(self.url)
+    
+    @cached_property
+    def simhash(self) -> int:
+        """64-bit SimHash of title and description for near-duplicate matching."""
+        return simhash64(f"{self.title} {self.description or ''}")
+    
+    @cached_property
     def content_hash(self) -> str:
-        """Generate content hash for deduplication."""
-        content_for_hash = f"{self.title}|{str(self.url)}|{self.description or ''}"
-        return hashlib.sha256(content_for_hash.encode()).hexdigest()
+        """Content fingerprint for deduplication (SimHash as hex)."""
+        return f"{self.simhash:016x}"
     
-    @property
+    def is_near_duplicate(self, other: "RawArticle", max_distance: int = SIMHASH_MAX_DISTANCE) -> bool:
+        """Check whether another article's SimHash is within max_distance bits."""
+        return simhash_distance(self.simhash, other.simhash) <= max_distance
+    
+    @cached_property
     def word_count(self) -> int:
         """Calculate approximate word count."""
         text = self.content or self.description or self.title
-        return len(text.split()) if text else 0
+        return (text.count(' ') + 1) if text else 0
+
+
+@dataclass(slots=True)
+class RawArticleRecord:
+    """
+    Unvalidated article record for the per-article discovery path.
+    
+    Holds only the fields used during deduplication and assessment; it is
+    converted to a validated RawArticle when results are assembled.
+    """
+    title: str
+    url: str
+    published_date: datetime
+    feed_source: str
+    feed_category: str
+    description: Optional[str] = None
+    content: Optional[str] = None
+    author: Optional[str] = None
+    tags: List[str] = field(default_factory=list)
+    
+    @property
+    def simhash(self) -> int:
+        """64-bit SimHash of title and description, as on RawArticle."""
+        return simhash64(f"{self.title} {self.description or ''}")
+    
+    def to_raw_article(self, trusted: bool = False) -> RawArticle:
+        """Convert into a RawArticle, validating unless the record is trusted."""
+        fields = {
+            'title': self.title,
+            'url': self.url,
+            'description': self.description,
+            'content': self.content,
+            'author': self.author,
+            'published_date': self.published_date,
+            'feed_source': self.feed_source,
+            'feed_category': self.feed_category,
+            'tags': self.tags
+        }
+        if trusted:
+            return RawArticle.construct_trusted(**fields)
+        return RawArticle(**fields)
 
 
 class ProcessedArticle(BaseModel):
@@ -119,8 +291,11 @@ class ProcessedArticle(BaseModel):
     quality_score: float = Field(default=0.0, ge=0.0, le=1.0, description="Content quality score")
     duplicate_of: Optional[UUID] = Field(None, description="UUID of original article if duplicate")
     
-    # Extracted metadata
-    extracted_entities: Dict[str, List[str]] = Field(default_factory=dict)
+    # Extracted metadata, entities flattened by type: entities of entity_types[i]
+    # are entities[entity_offsets[i]:entity_offsets[i + 1]]
+    entity_types: Tuple[str, ...] = Field(default=(), exclude=True)
+    entities: Tuple[str, ...] = Field(default=(), exclude=True)
+    entity_offsets: Tuple[int, ...] = Field(default=(0,), exclude=True)
     keywords: List[str] = Field(default_factory=list)
     categories: List[str] = Field(default_factory=list)
     
@@ -128,12 +303,64 @@ class ProcessedArticle(BaseModel):
     processing_time: float = Field(default=0.0, description="Processing time in seconds")
     processing_cost: float = Field(default=0.0, description="API cost in USD")
     error_message: Optional[str] = None
-    processed_at: datetime = Field(default_factory=datetime.utcnow)
+    processed_at_ns: int = Field(default_factory=time.time_ns, exclude=True, description="Processing time, epoch ns")
+    
+    @computed_field
+    @property
+    def processed_at(self) -> datetime:
+        """Processing completion time as a naive UTC datetime."""
+        return ns_to_utc_datetime(self.processed_at_ns)
+    
+    @model_validator(mode='before')
+    @classmethod
+    def restore_processed_at(cls, data: Any) -> Any:
+        """Accept a dumped processed_at datetime."""
+        return timestamp_to_ns(data, "processed_at")
+    
+    @model_validator(mode='before')
+    @classmethod
+    def flatten_entities(cls, data: Any) -> Any:
+        """Accept an extracted_entities dict and store it as flat tuples."""
+        if isinstance(data, dict) and "extracted_entities" in data:
+            data = dict(data)
+            entity_types = []
+            entities = []
+            offsets = [0]
+            for entity_type, values in data.pop("extracted_entities").items():
+                entity_types.append(sys.intern(entity_type))
+                entities.extend(sys.intern(value) for value in values)
+                offsets.append(len(entities))
+            data["entity_types"] = tuple(entity_types)
+            data["entities"] = tuple(entities)
+            data["entity_offsets"] = tuple(offsets)
+        return data
+    
+    def entities_of_type(self, index: int) -> Tuple[str, ...]:
+        """Entities of entity_types[index]."""
+        return self.entities[self.entity_offsets[index]:self.entity_offsets[index + 1]]
+    
+    @computed_field
+    @property
+    def extracted_entities(self) -> Dict[str, List[str]]:
+        """Entities grouped by type, rebuilt from the flat tuples."""
+        return {
+            entity_type: list(self.entities_of_type(i))
+            for i, entity_type in enumerate(self.entity_types)
+        }
     
-    @validator('relevance_score', 'quality_score')
+    @field_validator('relevance_score', 'quality_score')
     def score_range(cls, v):
         """Ensure scores are in valid range."""
         return max(0.0, min(1.0, v))
+    
+    @field_validator('keywords', 'categories')
+    def intern_labels(cls, v):
+        """Share one string per distinct keyword or category across articles."""
+        return [sys.intern(label) for label in v]
+
+
+# Numeric ProcessedArticle fields mirrored as columns on FeedProcessingResult
+ARTICLE_METRIC_COLUMNS = ('relevance_score', 'quality_score', 'processing_cost', 'processing_time')
 
 
 class FeedProcessingResult(BaseModel):
@@ -146,7 +373,9 @@ class FeedProcessingResult(BaseModel):
     articles_found: int = Field(default=0, description="Total articles in feed")
     articles_new: int = Field(default=0, description="New articles discovered")
     articles_duplicates: int = Field(default=0, description="Duplicate articles filtered")
+    articles_stale: int = Field(default=0, description="Articles older than the age limit")
     articles_processed: int = Field(default=0, description="Articles successfully processed")
+    articles_relevant: int = Field(default=0, description="Processed articles meeting the relevance threshold")
     articles_errors: int = Field(default=0, description="Articles with processing errors")
     
     # Performance metrics
@@ -159,9 +388,67 @@ class FeedProcessingResult(BaseModel):
     errors: List[str] = Field(default_factory=list)
     
     # Metadata
-    started_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at_ns: int = Field(default_factory=time.time_ns, exclude=True, description="Start time, epoch ns")
     completed_at: Optional[datetime] = None
     
+    @computed_field
+    @property
+    def started_at(self) -> datetime:
+        """Start time as a naive UTC datetime."""
+        return ns_to_utc_datetime(self.started_at_ns)
+    
+    @model_validator(mode='before')
+    @classmethod
+    def restore_started_at(cls, data: Any) -> Any:
+        """Accept a dumped started_at datetime."""
+        return timestamp_to_ns(data, "started_at")
+    
+    # Numeric fields of processed_articles, kept as flat columns for aggregation
+    _columns: Dict[str, array] = PrivateAttr(
+        default_factory=lambda: {name: array('d') for name in ARTICLE_METRIC_COLUMNS}
+    )
+    _relevance_sum: float = PrivateAttr(default=0.0)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Seed the metric columns from articles passed at construction."""
+        for name, column in self._columns.items():
+            column.extend(getattr(a, name) for a in self.processed_articles)
+        self._relevance_sum = sum(self._columns['relevance_score'])
+    
+    def column(self, name: str) -> array:
+        """Values of one numeric ProcessedArticle field, in processed_articles order."""
+        return self._columns[name]
+    
+    @property
+    def relevance_scores(self) -> array:
+        """Relevance scores in the same order as processed_articles."""
+        return self._columns['relevance_score']
+    
+    def add_processed_article(self, article: ProcessedArticle) -> None:
+        """Append a processed article and record its numeric fields."""
+        self.processed_articles.append(article)
+        for name, column in self._columns.items():
+            column.append(getattr(article, name))
+        self._relevance_sum += article.relevance_score
+    
+    def count_relevant(self, min_relevance_score: float) -> int:
+        """Count processed articles at or above a relevance threshold."""
+        return sum(1 for score in self._columns['relevance_score'] if score >= min_relevance_score)
+    
+    def relevant_articles(self, min_relevance_score: float) -> List[ProcessedArticle]:
+        """Processed articles at or above a relevance threshold, found via the score column."""
+        articles = self.processed_articles
+        return [
+            articles[i]
+            for i, score in enumerate(self._columns['relevance_score'])
+            if score >= min_relevance_score
+        ]
+    
+    @property
+    def total_processing_cost(self) -> float:
+        """Sum of per-article processing cost in USD."""
+        return sum(self._columns['processing_cost'])
+    
     @property
     def success_rate(self) -> float:
         """Calculate processing success rate."""
@@ -172,10 +459,8 @@ class FeedProcessingResult(BaseModel):
     @property
     def avg_relevance(self) -> float:
         """Calculate average relevance score."""
-        if not self.processed_articles:
-            return 0.0
-        scores = [a.relevance_score for a in self.processed_articles]
-        return sum(scores) / len(scores)
+        count = len(self._columns['relevance_score'])
+        return self._relevance_sum / count if count else 0.0
 
 
 class DiscoverySessionConfig(BaseModel):
@@ -188,6 +473,8 @@ class DiscoverySessionConfig(BaseModel):
     # Processing limits
     max_articles_per_source: int = Field(default=50, ge=1, le=200)
     max_total_articles: int = Field(default=500, ge=1, le=2000)
+    max_article_age_hours: int = Field(default=72, ge=1, le=720, description="Skip feed items published earlier than this")
+    trust_feed_data: bool = Field(default=False, description="Skip per-article validation of aggregator rows")
     
     # Quality filters
     min_relevance_score: float = Field(default=0.7, ge=0.0, le=1.0)
@@ -197,6 +484,14 @@ class DiscoverySessionConfig(BaseModel):
     delay_between_requests: float = Field(default=1.0, ge=0.1, le=10.0)
     request_timeout: int = Field(default=30, ge=5, le=120)
     
+    # Assessment concurrency
+    max_concurrent_assessments: int = Field(default=4, ge=1, le=16, description="Concurrent LLM assessment workers")
+    
+    # Batch assessment (OpenAI Batch API)
+    use_batch_api: bool = Field(default=False, description="Submit relevance assessments as one batch")
+    batch_poll_interval: float = Field(default=60.0, ge=5.0, le=600.0, description="Seconds between batch status polls")
+    batch_timeout_seconds: int = Field(default=3600, ge=60, le=86400, description="Give up on batch and fall back after this long")
+    
     # Deduplication
     similarity_threshold: float = Field(default=0.85, ge=0.5, le=1.0)
     content_hash_window_hours: int = Field(default=24, ge=1, le=168)
@@ -206,6 +501,25 @@ class DiscoverySessionConfig(BaseModel):
     cost_per_analysis: float = Field(default=0.01, ge=0.001)
 
 
+# Generations the dedup window is split into; expired entries age out one generation at a time
+DEDUP_WINDOW_GENERATIONS = 7
+
+
+@lru_cache(maxsize=4)
+def get_seen_filter(generation_size: int, window_hours: int) -> AgePartitionedBloomFilter:
+    """
+    Process-wide content fingerprint filter for a dedup window.
+
+    Shared by every discovery run with the same sizing, so the window spans
+    runs rather than resetting with each session.
+    """
+    return AgePartitionedBloomFilter(
+        generation_size=generation_size,
+        l=DEDUP_WINDOW_GENERATIONS,
+        generation_seconds=window_hours * 3600 / DEDUP_WINDOW_GENERATIONS
+    )
+
+
 class DiscoverySession(BaseModel):
     """Complete discovery session with results."""
     
@@ -214,7 +528,7 @@ class DiscoverySession(BaseModel):
     
     # Session status
     status: FeedStatus = Field(default=FeedStatus.PENDING)
-    started_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at_ns: int = Field(default_factory=time.time_ns, exclude=True, description="Start time, epoch ns")
     completed_at: Optional[datetime] = None
     
     # Results by feed
@@ -235,6 +549,52 @@ class DiscoverySession(BaseModel):
     errors: List[str] = Field(default_factory=list)
     warnings: List[str] = Field(default_factory=list)
     
+    @computed_field
+    @property
+    def started_at(self) -> datetime:
+        """Start time as a naive UTC datetime."""
+        return ns_to_utc_datetime(self.started_at_ns)
+    
+    @model_validator(mode='before')
+    @classmethod
+    def restore_started_at(cls, data: Any) -> Any:
+        """Accept a dumped started_at datetime."""
+        return timestamp_to_ns(data, "started_at")
+    
+    # Content fingerprints seen within content_hash_window_hours
+    _seen: Optional[AgePartitionedBloomFilter] = PrivateAttr(default=None)
+    
+    def use_seen_filter(self, seen_filter: AgePartitionedBloomFilter) -> None:
+        """Check fingerprints against a filter shared with other sessions."""
+        self._seen = seen_filter
+    
+    # Most relevant processed articles, capped at config.max_total_articles
+    _top_heap: List[Tuple[float, int, ProcessedArticle]] = PrivateAttr(default_factory=list)
+    _top_seq: int = PrivateAttr(default=0)
+    
+    def offer_article(self, article: ProcessedArticle) -> None:
+        """Keep the article if it ranks among the max_total_articles most relevant."""
+        entry = (article.relevance_score, self._top_seq, article)
+        self._top_seq += 1
+        if len(self._top_heap) < self.config.max_total_articles:
+            heapq.heappush(self._top_heap, entry)
+        else:
+            heapq.heappushpop(self._top_heap, entry)
+    
+    @property
+    def top_articles(self) -> List[ProcessedArticle]:
+        """Kept articles, most relevant first and in discovery order among ties."""
+        return [article for _, _, article in sorted(self._top_heap, key=lambda e: (-e[0], e[1]))]
+    
+    def seen(self, fingerprint: int) -> bool:
+        """Check a content fingerprint against the dedup window, recording it if new."""
+        if self._seen is None:
+            self._seen = get_seen_filter(self.config.max_total_articles, self.config.content_hash_window_hours)
+        if fingerprint in self._seen:
+            return True
+        self._seen.add(fingerprint)
+        return False
+    
     @property
     def success_rate(self) -> float:
         """Overall session success rate."""
@@ -290,10 +650,12 @@ __all__ = [
     "ArticleStatus", 
     "RSSFeedSource",
     "RawArticle",
+    "RawArticleRecord",
     "ProcessedArticle",
     "FeedProcessingResult",
     "DiscoverySessionConfig",
     "DiscoverySession",
     "NewsDiscoveryRequest",
     "NewsDiscoveryResponse",
+    "get_seen_filter",
 ]
\ No newline at end of file
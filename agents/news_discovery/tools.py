@@ -0,0 +1,435 @@
+"""
+Helper functions for the News Discovery Agent.
+
+Keyword matching, date parsing, rate limiting, fingerprinting and
+near-duplicate detection utilities used on the per-article discovery path.
+"""
+
+import asyncio
+import hashlib
+import os
+import random
+import re
+import time
+from array import array
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import tiktoken
+
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    xxhash = None
+    HAS_XXHASH = False
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso8601
+    HAS_CISO8601 = True
+except ImportError:
+    _parse_iso8601 = datetime.fromisoformat
+    HAS_CISO8601 = False
+
+
+def parse_published_date(value: Optional[str]) -> datetime:
+    """Parse an ISO-8601 publication date, falling back to now (UTC)."""
+    if value:
+        try:
+            return _parse_iso8601(value)
+        except ValueError:
+            pass
+    return datetime.now(timezone.utc)
+
+
+# Tokenizer shared by the gpt-4o / gpt-5 model families
+TOKEN_ENCODING = "o200k_base"
+
+
+@lru_cache(maxsize=1)
+def _get_encoding() -> "tiktoken.Encoding":
+    """Load the tokenizer once per process."""
+    return tiktoken.get_encoding(TOKEN_ENCODING)
+
+
+def count_tokens_batch(texts: List[str]) -> List[int]:
+    """
+    Count tokens for many texts in one parallel tiktoken call.
+    
+    Falls back to a word-count estimate if the tokenizer cannot be loaded.
+    """
+    if not texts:
+        return []
+    try:
+        encoded = _get_encoding().encode_batch(texts, num_threads=os.cpu_count() or 1)
+        return [len(tokens) for tokens in encoded]
+    except Exception:
+        return [int(len(text.split()) * 1.3) for text in texts]
+
+
+class KeywordMatcher:
+    """
+    Single-pass substring matcher for a fixed keyword set.
+
+    All keywords are compiled into one lookahead alternation, so the text is
+    scanned once in C instead of once per keyword. Matches follow plain
+    ``keyword in text`` semantics, including overlapping keywords.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = list(dict.fromkeys(keywords))
+
+        # Longest first so the alternation reports the longest keyword at a position
+        ordered = sorted(self.keywords, key=len, reverse=True)
+        self._pattern = re.compile("(?=(" + "|".join(re.escape(k) for k in ordered) + "))")
+
+        # Keywords that are prefixes of a match also occur at that position
+        self._prefixes: Dict[str, List[str]] = {
+            keyword: [k for k in self.keywords if keyword.startswith(k)]
+            for keyword in self.keywords
+        }
+
+        # Each keyword owns one bit, in keyword order
+        self.bits: Dict[str, int] = {keyword: 1 << i for i, keyword in enumerate(self.keywords)}
+        self._prefix_masks: Dict[str, int] = {
+            keyword: sum(self.bits[k] for k in prefixes)
+            for keyword, prefixes in self._prefixes.items()
+        }
+
+    def find(self, text: str) -> Set[str]:
+        """Return every keyword that occurs in the text."""
+        hits: Set[str] = set()
+        for match in self._pattern.finditer(text):
+            hits.update(self._prefixes[match.group(1)])
+        return hits
+
+    def mask_for(self, keywords: Iterable[str]) -> int:
+        """Return the bitmask covering the given keywords."""
+        mask = 0
+        for keyword in keywords:
+            mask |= self.bits[keyword]
+        return mask
+
+    def find_mask(self, text: str) -> int:
+        """Return the bitmask of every keyword that occurs in the text."""
+        prefix_masks = self._prefix_masks
+        hit_mask = 0
+        for match in self._pattern.finditer(text):
+            hit_mask |= prefix_masks[match.group(1)]
+        return hit_mask
+
+
+class AsyncTokenBucket:
+    """
+    Token-bucket rate limiter shared by concurrent coroutines.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``, so
+    idle time builds up a burst allowance. Use as ``async with bucket:``
+    around each rate-limited call.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            while True:
+                now = loop.time()
+                if self._updated is not None:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+    async def __aenter__(self) -> "AsyncTokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+# MinHash permutations are (a * x + b) mod p, truncated to 16-bit lanes
+_MERSENNE_PRIME = (1 << 61) - 1
+_LANE_BITS = 16
+_LANE_MASK = (1 << _LANE_BITS) - 1
+
+# Chance that two unrelated 16-bit lanes agree by accident
+_LANE_COLLISION = 1.0 / (1 << _LANE_BITS)
+
+
+def _blake2b_64(data) -> int:
+    """Stable 64-bit hash via blake2b, used when xxhash is unavailable."""
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+# Non-cryptographic 64-bit hash for shingles; xxh64 is much faster than blake2b
+_hash64 = xxhash.xxh64_intdigest if HAS_XXHASH else _blake2b_64
+
+
+# Word tokens for SimHash fingerprints
+_SIMHASH_TOKEN_RE = re.compile(r"\w+")
+
+# Fingerprints within this many differing bits are treated as near-duplicates
+SIMHASH_MAX_DISTANCE = 3
+
+
+def simhash64(text: str) -> int:
+    """
+    Charikar SimHash of a text as a 64-bit integer.
+
+    Each lowercase word token votes on every bit with its frequency as
+    weight, so texts differing only slightly get fingerprints a few bits apart.
+    """
+    counts = Counter(_SIMHASH_TOKEN_RE.findall(text.lower()))
+    if not counts:
+        return 0
+
+    totals = [0] * 64
+    for token, weight in counts.items():
+        h = _hash64(token.encode("utf-8"))
+        for bit in range(64):
+            if (h >> bit) & 1:
+                totals[bit] += weight
+            else:
+                totals[bit] -= weight
+
+    fingerprint = 0
+    for bit, total in enumerate(totals):
+        if total > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def simhash_distance(a: int, b: int) -> int:
+    """Number of differing bits between two SimHash fingerprints."""
+    return (a ^ b).bit_count()
+
+
+class AgePartitionedBloomFilter:
+    """
+    Sliding-window Bloom filter over 64-bit fingerprints.
+
+    The filter keeps ``k + l`` bit slices in a ring. Each insert sets one
+    bit in each of the ``k`` newest slices, and a fingerprint counts as
+    seen if ``k`` consecutive slices all have its bit set. After
+    ``generation_size`` inserts, or once ``generation_seconds`` have
+    passed, the oldest slice is cleared and becomes the newest. Items
+    therefore expire after about ``l`` generations. Bit positions come from
+    double hashing over the two 32-bit halves of the fingerprint.
+    """
+
+    def __init__(
+        self,
+        generation_size: int,
+        k: int = 10,
+        l: int = 7,
+        generation_seconds: Optional[float] = None,
+        bits_per_item: int = 4
+    ):
+        self.k = k
+        self.l = l
+        self.generation_size = max(1, generation_size)
+        self.generation_seconds = generation_seconds
+
+        # A slice receives inserts for k generations; keeping it sparse keeps
+        # the false positive rate far below 1%
+        self._slice_bits = self.generation_size * k * bits_per_item
+        self._slices = [bytearray((self._slice_bits + 7) // 8) for _ in range(k + l)]
+        self._base = 0
+        self._inserted = 0
+        self._generation_started = time.monotonic()
+
+    def _positions(self, fingerprint: int) -> List[int]:
+        """Bit position of the fingerprint in each physical slice."""
+        h1 = fingerprint & 0xFFFFFFFF
+        h2 = (fingerprint >> 32) | 1
+        return [(h1 + i * h2) % self._slice_bits for i in range(len(self._slices))]
+
+    def _advance(self) -> None:
+        """Retire the oldest slice and reuse it as the newest one."""
+        self._base = (self._base - 1) % len(self._slices)
+        self._slices[self._base] = bytearray(len(self._slices[self._base]))
+        self._inserted = 0
+        self._generation_started = time.monotonic()
+
+    def _expire(self) -> None:
+        if self.generation_seconds is None:
+            return
+        elapsed = time.monotonic() - self._generation_started
+        for _ in range(min(len(self._slices), int(elapsed // self.generation_seconds))):
+            self._advance()
+
+    def __contains__(self, fingerprint: int) -> bool:
+        self._expire()
+        positions = self._positions(fingerprint)
+        total = len(self._slices)
+        run = 0
+        for offset in range(total):
+            physical = (self._base + offset) % total
+            bit = positions[physical]
+            if self._slices[physical][bit >> 3] & (1 << (bit & 7)):
+                run += 1
+                if run >= self.k:
+                    return True
+            else:
+                run = 0
+        return False
+
+    def add(self, fingerprint: int) -> None:
+        """Insert a fingerprint into the current generation."""
+        self._expire()
+        if self._inserted >= self.generation_size:
+            self._advance()
+
+        positions = self._positions(fingerprint)
+        total = len(self._slices)
+        for offset in range(self.k):
+            physical = (self._base + offset) % total
+            bit = positions[physical]
+            self._slices[physical][bit >> 3] |= 1 << (bit & 7)
+        self._inserted += 1
+
+
+def _optimal_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """Pick (bands, rows) whose LSH S-curve midpoint is closest to threshold."""
+    best = (1, num_perm)
+    best_error = float("inf")
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        error = abs((1.0 / bands) ** (1.0 / rows) - threshold)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class MinHashLSH:
+    """
+    MinHash signatures with a banded LSH index for near-duplicate detection.
+
+    Documents are split into word shingles, signed with ``num_perm`` MinHash
+    permutations and bucketed by band. A lookup only compares against
+    documents sharing at least one band, then confirms the estimated Jaccard
+    similarity against ``threshold``.
+
+    Signature lanes are stored as 16-bit values (2 bytes per permutation);
+    the similarity estimate corrects for the resulting accidental lane
+    collisions.
+    """
+
+    def __init__(self, threshold: float = 0.85, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = _optimal_bands(threshold, num_perm)
+
+        rng = random.Random(seed)
+        self._perm_a = [rng.randint(1, _MERSENNE_PRIME - 1) for _ in range(num_perm)]
+        self._perm_b = [rng.randint(0, _MERSENNE_PRIME - 1) for _ in range(num_perm)]
+
+        self._buckets: List[Dict[bytes, List[str]]] = [
+            defaultdict(list) for _ in range(self.bands)
+        ]
+        self._signatures: Dict[str, array] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._signatures
+
+    def _shingle_hashes(self, text: str) -> Set[int]:
+        """Hash lowercase word shingles without building shingle strings."""
+        words = text.lower().split()
+        if not words:
+            return set()
+        
+        # Hash each word once, then hash windows of the packed word hashes
+        word_hashes = array('Q', [_hash64(word.encode("utf-8")) for word in words])
+        buffer = memoryview(word_hashes).cast('B')
+        width = word_hashes.itemsize
+        size = min(self.shingle_size, len(words))
+        span = size * width
+        
+        return {
+            _hash64(buffer[i * width:i * width + span])
+            for i in range(len(words) - size + 1)
+        }
+    
+    def signature(self, text: str) -> Optional[array]:
+        """Compute the 16-bit MinHash signature of a text, or None if it has no words."""
+        hashes = self._shingle_hashes(text)
+        if not hashes:
+            return None
+        return array('H', [
+            min(((a * h + b) % _MERSENNE_PRIME) & _LANE_MASK for h in hashes)
+            for a, b in zip(self._perm_a, self._perm_b)
+        ])
+    
+    def _band_keys(self, signature: array) -> List[bytes]:
+        rows = self.rows
+        return [signature[i * rows:(i + 1) * rows].tobytes() for i in range(self.bands)]
+
+    def query(self, signature: array) -> List[str]:
+        """Return keys of indexed documents similar to the signature."""
+        candidates: Set[str] = set()
+        for band, band_key in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(band_key, ()))
+
+        matches = []
+        for key in candidates:
+            other = self._signatures[key]
+            agreement = sum(1 for x, y in zip(signature, other) if x == y) / self.num_perm
+            similarity = (agreement - _LANE_COLLISION) / (1.0 - _LANE_COLLISION)
+            if similarity >= self.threshold:
+                matches.append(key)
+        return matches
+
+    def insert(self, key: str, signature: array) -> None:
+        """Add a document signature to the index."""
+        if key in self._signatures:
+            return
+        self._signatures[key] = signature
+        for band, band_key in enumerate(self._band_keys(signature)):
+            self._buckets[band][band_key].append(key)
+
+    def check_and_insert(self, key: str, text: str) -> bool:
+        """Return True if the document duplicates an indexed one, else index it."""
+        if key in self._signatures:
+            return True
+
+        signature = self.signature(text)
+        if signature is None:
+            return False
+
+        if self.query(signature):
+            return True
+
+        self.insert(key, signature)
+        return False
+
+
+__all__ = [
+    'AgePartitionedBloomFilter',
+    'AsyncTokenBucket',
+    'count_tokens_batch',
+    'parse_published_date',
+    'KeywordMatcher',
+    'MinHashLSH',
+    'SIMHASH_MAX_DISTANCE',
+    'simhash64',
+    'simhash_distance',
+]
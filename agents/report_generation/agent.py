@@ -6,35 +6,45 @@ trend analysis, and multi-format output (HTML, email, text).
 """
 
 import asyncio
+import heapq
+import re
 import time
-from datetime import datetime, timedelta, timezone
+from array import array
+from datetime import date, datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional, Tuple
 import logging
 from collections import defaultdict, Counter
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from itertools import chain
+from operator import attrgetter
 import statistics
 
 from pydantic_ai import Agent, RunContext
 from pydantic import BaseModel, Field
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template, TemplateError
 
 from config.settings import get_settings
 from .models import (
     ReportGenerationRequest, ReportGenerationResponse, Report, ReportMetadata,
-    ReportSectionData, ReportSection, ArticleSummary, TrendData, ReportType,
-    ReportStatus, ReportFormat
+    ReportSectionData, ReportSection, ArticleSummaryRecord, TrendData, ReportType,
+    ReportStatus, ReportFormat, ReportDeliveryResponse, format_display_date
 )
 from agents.content_analysis.models import ContentAnalysis
 from database.models import NewsArticle, NewsSource
-from mcp_servers.email_notifications import TemplateEmailRequest, send_templated_email
+from mcp_servers.email_notifications import EmailRequest, email_service, send_email
 from utils.cost_tracking import CostTracker, ServiceType
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+
 
 class ReportGenerationDeps(BaseModel):
     """Dependencies for Report Generation Agent."""
+    # Frozen so one instance can be shared by concurrent agent runs
+    model_config = {"arbitrary_types_allowed": True, "frozen": True}
+    
     cost_tracker: CostTracker
     settings: Any
     template_env: Environment
@@ -50,12 +60,7 @@ class ReportSummaryData(BaseModel):
     section_summaries: Dict[str, str] = Field(default_factory=dict)
 
 
-# Create Report Generation Agent
-report_generation_agent = Agent(
-    'openai:gpt-5-mini',
-    deps_type=ReportGenerationDeps,
-    result_type=ReportSummaryData,
-    system_prompt="""You are an AI Report Generation Agent specialized in creating comprehensive, professional AI news reports.
+REPORT_SYSTEM_PROMPT = """You are an AI Report Generation Agent specialized in creating comprehensive, professional AI news reports.
 
 Your role is to:
 1. Synthesize complex AI news into clear, actionable insights
@@ -105,9 +110,324 @@ WRITING STYLE:
 - Use present tense for current developments
 
 Focus on creating reports that busy professionals can quickly scan for key information while providing enough depth for strategic decision-making."""
+
+# Create Report Generation Agent
+report_generation_agent = Agent(
+    'openai:gpt-5-mini',
+    deps_type=ReportGenerationDeps,
+    result_type=ReportSummaryData,
+    system_prompt=REPORT_SYSTEM_PROMPT
+)
+
+
+_get_source = attrgetter('source')
+_get_summary = attrgetter('summary')
+_get_relevance = attrgetter('relevance_score')
+_get_quality = attrgetter('quality_score')
+_get_topics = attrgetter('topics')
+
+
+@dataclass
+class ArticleColumns:
+    """
+    Per-article derived fields, computed once and shared by the report passes.
+    
+    Columns are index-aligned with the article summaries they were built from.
+    """
+    lower_text: List[str]
+    dates: List[date]
+    sources: List[str]
+    relevance: array
+    quality: array
+    
+    @classmethod
+    def from_summaries(cls, articles: List[ArticleSummaryRecord]) -> "ArticleColumns":
+        """Build the columns from the summaries, mapping plain fields with attrgetter."""
+        return cls(
+            lower_text=[f"{article.title} {article.summary}".lower() for article in articles],
+            dates=[article.published_date.date() for article in articles],
+            sources=list(map(_get_source, articles)),
+            relevance=array('d', map(_get_relevance, articles)),
+            quality=array('d', map(_get_quality, articles))
+        )
+    
+    @cached_property
+    def source_counts(self) -> Counter:
+        """Articles per source, shared by the metadata and the fallback summary."""
+        return Counter(self.sources)
+    
+    @cached_property
+    def avg_relevance(self) -> float:
+        """Mean relevance score, shared by the metadata and the fallback summary."""
+        return statistics.fmean(self.relevance) if self.relevance else 0.0
+
+
+class BatchReportSummaryData(BaseModel):
+    """AI-generated summaries for several reports in one response."""
+    reports: List[ReportSummaryData] = Field(..., description="One summary per report, in prompt order")
+
+
+# Same instructions, structured output for a batch of reports
+batch_summary_agent = Agent(
+    'openai:gpt-5-mini',
+    deps_type=ReportGenerationDeps,
+    result_type=BatchReportSummaryData,
+    system_prompt=REPORT_SYSTEM_PROMPT
 )
 
 
+class BatchReportSummarizer:
+    """
+    Coalesce concurrent report summary prompts into one agent run.
+    
+    Prompts submitted within ``max_wait_seconds`` of each other, up to
+    ``max_batch_size``, are sent as a single structured-output request.
+    A lone prompt goes through the regular report agent. Both agents share
+    the static ``REPORT_SYSTEM_PROMPT``, so clustered runs reuse the
+    provider's cached prompt prefix.
+    """
+    
+    def __init__(self, max_batch_size: int = 4, max_wait_seconds: float = 0.05):
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def submit(self, prompt: str, deps: ReportGenerationDeps) -> Tuple[ReportSummaryData, int]:
+        """Queue a prompt and wait for its summary and its share of cached prompt tokens."""
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+        
+        future = loop.create_future()
+        await self._queue.put((prompt, deps, future))
+        return await future
+    
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait_seconds
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._dispatch(batch)
+    
+    async def _dispatch(self, batch: List[Tuple[str, ReportGenerationDeps, asyncio.Future]]) -> None:
+        try:
+            if len(batch) == 1:
+                prompt, deps, _ = batch[0]
+                result = await report_generation_agent.run(prompt, deps=deps)
+                summaries = [result.data]
+            else:
+                combined = "\n\n".join(
+                    f"=== REPORT {i + 1} ===\n{prompt}" for i, (prompt, _, _) in enumerate(batch)
+                )
+                result = await batch_summary_agent.run(
+                    f"Generate a separate summary for each of the {len(batch)} reports below, in order.\n\n{combined}",
+                    deps=batch[0][1]
+                )
+                summaries = result.data.reports
+                if len(summaries) != len(batch):
+                    raise ValueError(f"Expected {len(batch)} report summaries, got {len(summaries)}")
+            cached_tokens = (result.usage().details or {}).get('cached_tokens', 0)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        logger.debug("Report summary batch of %d reused %d cached prompt tokens", len(batch), cached_tokens)
+        for (_, _, future), summary in zip(batch, summaries):
+            if not future.done():
+                future.set_result((summary, cached_tokens // len(batch)))
+
+
+# Section categorization keywords, matched against lowercase title and summary
+SECTION_KEYWORDS = {
+    ReportSection.BREAKING_NEWS: ["breaking", "urgent", "alert", "just in"],
+    ReportSection.KEY_DEVELOPMENTS: ["announces", "launches", "releases", "introduces"],
+    ReportSection.RESEARCH_HIGHLIGHTS: ["research", "study", "paper", "findings", "arxiv"],
+    ReportSection.INDUSTRY_ANALYSIS: ["market", "industry", "analysis", "trends", "outlook"],
+    ReportSection.FUNDING_NEWS: ["funding", "investment", "raises", "series", "valuation"],
+    ReportSection.PRODUCT_LAUNCHES: ["product", "launch", "feature", "release", "beta"],
+    ReportSection.REGULATORY_UPDATES: ["regulation", "policy", "law", "compliance", "government"]
+}
+
+# Display titles and priorities (lower = higher priority) for report sections
+SECTION_TITLES = {
+    ReportSection.BREAKING_NEWS: "🚨 Breaking News",
+    ReportSection.KEY_DEVELOPMENTS: "🔑 Key Developments",
+    ReportSection.RESEARCH_HIGHLIGHTS: "🔬 Research Highlights",
+    ReportSection.INDUSTRY_ANALYSIS: "📊 Industry Analysis",
+    ReportSection.FUNDING_NEWS: "💰 Funding & Investments",
+    ReportSection.PRODUCT_LAUNCHES: "🚀 Product Launches",
+    ReportSection.REGULATORY_UPDATES: "⚖️ Regulatory Updates",
+    ReportSection.TREND_ANALYSIS: "📈 Trend Analysis",
+    ReportSection.MARKET_IMPACT: "🎯 Market Impact"
+}
+
+SECTION_PRIORITIES = {
+    ReportSection.EXECUTIVE_SUMMARY: 1,
+    ReportSection.BREAKING_NEWS: 2,
+    ReportSection.KEY_DEVELOPMENTS: 3,
+    ReportSection.RESEARCH_HIGHLIGHTS: 4,
+    ReportSection.INDUSTRY_ANALYSIS: 5,
+    ReportSection.FUNDING_NEWS: 6,
+    ReportSection.PRODUCT_LAUNCHES: 7,
+    ReportSection.REGULATORY_UPDATES: 8,
+    ReportSection.TREND_ANALYSIS: 9,
+    ReportSection.MARKET_IMPACT: 10
+}
+
+# Base report titles by report type
+REPORT_TYPE_TITLES = {
+    ReportType.DAILY: "Daily AI News Digest",
+    ReportType.WEEKLY: "Weekly AI Industry Report", 
+    ReportType.MONTHLY: "Monthly AI Market Analysis",
+    ReportType.BREAKING: "Breaking AI News Alert",
+    ReportType.CUSTOM: "AI News Report"
+}
+
+
+@lru_cache(maxsize=256)
+def _format_report_title(report_type: ReportType, period_start: date, period_end: date) -> str:
+    """Build a report title; only the period dates matter, so it caches per day."""
+    base_title = REPORT_TYPE_TITLES.get(report_type, "AI News Report")
+    
+    # Add date context
+    if report_type == ReportType.DAILY:
+        date_str = period_end.strftime("%B %d, %Y")
+        return f"{base_title} - {date_str}"
+    elif report_type == ReportType.WEEKLY:
+        week_start = period_start.strftime("%B %d")
+        week_end = period_end.strftime("%B %d, %Y")
+        return f"{base_title} - {week_start} to {week_end}"
+    elif report_type == ReportType.MONTHLY:
+        month_year = period_end.strftime("%B %Y")
+        return f"{base_title} - {month_year}"
+    
+    return base_title
+
+
+# Static headings shared by every markdown and plain text report
+MARKDOWN_TREND_HEADER = "\n## Trend Analysis\n\n"
+TEXT_SUMMARY_HEADER = "EXECUTIVE SUMMARY\n-----------------\n"
+
+
+@lru_cache(maxsize=None)
+def _text_section_heading(title: str) -> str:
+    """Underlined plain text heading; section titles come from a small fixed set."""
+    return f"\n{title.upper()}\n{'-' * len(title)}\n\n"
+
+
+# Recipients per delivery email (EmailRequest's to_addresses limit) and concurrent sends
+EMAIL_RECIPIENT_BATCH_SIZE = 100
+EMAIL_DELIVERY_CONCURRENCY = 8
+
+
+# Translation table deleting sentence terminators; the length drop counts them
+_DELETE_SENTENCE_ENDS = str.maketrans('', '', '.!?')
+
+
+# Number of flags packed by _calculate_completeness
+COMPLETENESS_FACTOR_COUNT = 7
+
+
+# Default HTML report layout, used when no report-specific template exists
+DEFAULT_HTML_TEMPLATE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>{{ metadata.title }}</title>
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 800px; margin: 0 auto; padding: 20px; }
+        .header { text-align: center; border-bottom: 2px solid #2563eb; padding-bottom: 20px; margin-bottom: 30px; }
+        .section { margin-bottom: 40px; }
+        .article { border-left: 3px solid #e5e7eb; padding-left: 15px; margin-bottom: 20px; }
+        .metrics { background: #f3f4f6; padding: 15px; border-radius: 5px; margin: 20px 0; }
+        .trend { background: #fef3c7; padding: 10px; border-radius: 5px; margin: 10px 0; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>{{ metadata.title }}</h1>
+        <p>{{ metadata.period_start.strftime('%B %d, %Y') }} - {{ metadata.period_end.strftime('%B %d, %Y') }}</p>
+        <div class="metrics">
+            {{ metadata.total_articles }} articles | {{ metadata.sources_covered }} sources | 
+            Avg relevance: {{ "%.1f"|format(metadata.avg_relevance_score * 100) }}%
+        </div>
+    </div>
+    
+    <div class="section">
+        <h2>Executive Summary</h2>
+        <p>{{ report.executive_summary }}</p>
+    </div>
+    
+    {% for section in sections %}
+    <div class="section">
+        <h2>{{ section.title }}</h2>
+        {% for article in section.articles %}
+        <div class="article">
+            <h3><a href="{{ article.url }}">{{ article.title }}</a></h3>
+            <p><strong>{{ article.source }}</strong> | {{ article.published_date_str }}</p>
+            <p>{{ article.summary }}</p>
+        </div>
+        {% endfor %}
+    </div>
+    {% endfor %}
+    
+    {% if trends %}
+    <div class="section">
+        <h2>Trend Analysis</h2>
+        {% for trend in trends %}
+        <div class="trend">
+            <h3>{{ trend.trend_name }}</h3>
+            <p>{{ trend.description }}</p>
+        </div>
+        {% endfor %}
+    </div>
+    {% endif %}
+</body>
+</html>
+"""
+
+
+# Shared template environment (singleton pattern)
+_template_env: Optional[Environment] = None
+
+def get_template_env() -> Environment:
+    """
+    Get the shared report template environment.
+    
+    Compiled templates are also written to a filesystem bytecode cache, so
+    other worker processes skip parsing templates on their first render.
+    """
+    global _template_env
+    if _template_env is None:
+        from pathlib import Path
+        template_dir = Path(__file__).parent.parent.parent / "templates" / "reports"
+        template_dir.mkdir(parents=True, exist_ok=True)
+        
+        _template_env = Environment(
+            loader=FileSystemLoader(str(template_dir)),
+            autoescape=True,
+            trim_blocks=True,
+            lstrip_blocks=True,
+            bytecode_cache=FileSystemBytecodeCache()
+        )
+    return _template_env
+
+
 class ReportGenerationService:
     """Service for generating comprehensive news reports."""
     
@@ -116,12 +436,38 @@ class ReportGenerationService:
         self.settings = get_settings()
         self.cost_tracker = CostTracker()
         
-        # Setup template environment
+        # Setup template environment and compile templates once
         self.template_env = self._setup_templates()
+        self._default_html_template = self.template_env.from_string(DEFAULT_HTML_TEMPLATE)
+        self._load_template = lru_cache(maxsize=None)(self._load_template_uncached)
+        
+        # Compiled delivery email templates, resolved once per report type
+        self._email_templates: Dict[ReportType, Template] = {}
+        
+        # Agent dependencies never change, so build them once
+        self._deps = ReportGenerationDeps(
+            cost_tracker=self.cost_tracker,
+            settings=self.settings,
+            template_env=self.template_env
+        )
+        self.report_templates = {
+            report_type: template
+            for report_type in ReportType
+            if (template := self._load_template(f"{report_type.value}_report.html")) is not None
+        }
+        
+        # One compiled alternation per section instead of a substring scan per keyword
+        self._section_patterns = {
+            section: re.compile("|".join(re.escape(keyword) for keyword in keywords))
+            for section, keywords in SECTION_KEYWORDS.items()
+        }
         
         # Report cache
         self.report_cache = {}
         
+        # Concurrent reports share LLM round-trips
+        self._batch_summarizer = BatchReportSummarizer()
+        
         # Standard sections for different report types
         self.standard_sections = {
             ReportType.DAILY: [
@@ -156,24 +502,23 @@ class ReportGenerationService:
     
     def _setup_templates(self) -> Environment:
         """Setup Jinja2 template environment."""
-        from pathlib import Path
-        template_dir = Path(__file__).parent.parent.parent / "templates" / "reports"
-        template_dir.mkdir(parents=True, exist_ok=True)
-        
-        return Environment(
-            loader=FileSystemLoader(str(template_dir)),
-            autoescape=True,
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
+        return get_template_env()
+    
+    def _load_template_uncached(self, template_name: str) -> Optional[Template]:
+        """Compile a named template, or None if it is missing or invalid."""
+        try:
+            return self.template_env.get_template(template_name)
+        except TemplateError:
+            return None
     
     async def generate_report(self, request: ReportGenerationRequest) -> ReportGenerationResponse:
         """Generate comprehensive news report."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         generation_cost = 0.0
         
         try:
-            logger.info(f"Generating {request.report_type.value} report for {request.period_start} to {request.period_end}")
+            logger.info("Generating %s report for %s to %s",
+                        request.report_type.value, request.period_start, request.period_end)
             
             # Initialize report metadata
             metadata = ReportMetadata(
@@ -189,72 +534,97 @@ class ReportGenerationService:
             
             # Fetch articles for the time period
             articles = await self._fetch_articles(request)
-            logger.info(f"Fetched {len(articles)} articles for analysis")
+            logger.info("Fetched %d articles for analysis", len(articles))
             
             if not articles:
                 return ReportGenerationResponse(
                     success=False,
                     report=None,
                     error_message="No articles found for the specified time period",
-                    processing_time=time.time() - start_time,
+                    processing_time=time.perf_counter() - start_time,
                     generation_cost=0.0,
                     articles_processed=0,
                     sections_generated=0
                 )
             
+            # Create article summaries and their derived columns
+            article_summaries = [self._create_article_summary(article) for article in articles]
+            columns = ArticleColumns.from_summaries(article_summaries)
+            
             # Update metadata with article stats
             metadata.total_articles = len(articles)
-            metadata.sources_covered = len(set(article.source for article in articles))
-            metadata.avg_relevance_score = statistics.mean(article.relevance_score for article in articles)
-            metadata.avg_quality_score = statistics.mean(article.quality_score for article in articles)
-            
-            # Create article summaries
-            article_summaries = [self._create_article_summary(article) for article in articles]
+            metadata.sources_covered = len(columns.source_counts)
+            metadata.avg_relevance_score = columns.avg_relevance
+            metadata.avg_quality_score = statistics.fmean(columns.quality)
             
-            # Organize articles into sections
-            sections = await self._organize_into_sections(
+            # Organize articles into sections and generate trends if requested, concurrently
+            sections_task = self._organize_into_sections(
                 article_summaries, 
                 request.included_sections,
-                request.max_articles_per_section
+                request.max_articles_per_section,
+                columns
             )
-            
-            # Generate trends if requested
-            trends = []
             if request.include_trends:
-                trends = await self._analyze_trends(article_summaries, request)
+                sections, trends = await asyncio.gather(
+                    sections_task,
+                    self._analyze_trends(article_summaries, request, columns)
+                )
+            else:
+                sections, trends = await sections_task, []
             
-            # Generate AI summaries and insights
-            summary_data = await self._generate_ai_summaries(
-                article_summaries, 
-                sections, 
-                trends, 
-                request
+            # Section bodies don't depend on the AI summary, so render them while it generates
+            body_jobs = {}
+            if ReportFormat.MARKDOWN in request.output_formats:
+                body_jobs['markdown_content'] = asyncio.to_thread(self._render_markdown_body, sections, trends)
+            
+            if ReportFormat.TEXT in request.output_formats:
+                body_jobs['text_content'] = asyncio.to_thread(self._render_text_body, sections)
+            
+            # Generate AI summaries and insights alongside the bodies; the first failure propagates
+            (summary_data, cached_tokens), *bodies = await asyncio.gather(
+                self._generate_ai_summaries(
+                    article_summaries, 
+                    sections, 
+                    trends, 
+                    request,
+                    columns
+                ),
+                *body_jobs.values()
             )
+            rendered_bodies = dict(zip(body_jobs, bodies))
             generation_cost += 0.15  # Estimated cost for AI generation
             
-            # Create complete report
-            report = Report(
+            # Create complete report; its parts were built and validated by the pipeline
+            report = Report.model_construct(
                 metadata=metadata,
-                sections=sections,
+                sections=tuple(sections),
                 trends=trends,
                 executive_summary=summary_data.executive_summary,
                 key_insights=summary_data.key_insights,
                 recommendations=summary_data.recommendations
             )
             
-            # Generate formatted content
+            # Generate formatted content; the formats are independent, so build them concurrently
+            format_jobs = {}
             if ReportFormat.HTML in request.output_formats:
-                report.html_content = await self._generate_html_content(report, request)
+                format_jobs['html_content'] = self._generate_html_content(report, request)
             
-            if ReportFormat.MARKDOWN in request.output_formats:
-                report.markdown_content = self._generate_markdown_content(report)
+            if 'markdown_content' in rendered_bodies:
+                format_jobs['markdown_content'] = asyncio.to_thread(
+                    self._generate_markdown_content, report, rendered_bodies['markdown_content']
+                )
             
-            if ReportFormat.TEXT in request.output_formats:
-                report.text_content = self._generate_text_content(report)
+            if 'text_content' in rendered_bodies:
+                format_jobs['text_content'] = asyncio.to_thread(
+                    self._generate_text_content, report, rendered_bodies['text_content']
+                )
+            
+            for field_name, content in zip(format_jobs, await asyncio.gather(*format_jobs.values())):
+                setattr(report, field_name, content)
             
             # Update metadata
             report.metadata.status = ReportStatus.READY
-            report.metadata.generation_time = time.time() - start_time
+            report.metadata.generation_time = time.perf_counter() - start_time
             report.metadata.generation_cost = generation_cost
             report.metadata.completeness_score = self._calculate_completeness(report)
             report.metadata.readability_score = self._calculate_readability(report)
@@ -264,7 +634,7 @@ class ReportGenerationService:
                 delivery_response = await self._deliver_report(report, request)
                 if delivery_response.success:
                     report.metadata.status = ReportStatus.DELIVERED
-                    report.metadata.delivered_at = datetime.utcnow()
+                    report.metadata.delivered_at = datetime.now(_UTC)
                 else:
                     report.metadata.delivery_errors.extend(delivery_response.delivery_errors)
             
@@ -276,12 +646,15 @@ class ReportGenerationService:
                 operation="report_generation",
                 service=ServiceType.OPENAI,
                 model=request.generation_model,
-                input_tokens=sum(len(a.summary.split()) for a in article_summaries) * 1.3,
-                output_tokens=len(summary_data.executive_summary.split()) * 10,
-                cost_usd=generation_cost
+                input_tokens=sum(
+                    summary.count(' ') + 1 for summary in map(_get_summary, article_summaries)
+                ) * 1.3,
+                output_tokens=(summary_data.executive_summary.count(' ') + 1) * 10,
+                cost_usd=generation_cost,
+                cached_tokens=cached_tokens
             )
             
-            logger.info(f"Report generation completed: {len(sections)} sections, {len(trends)} trends")
+            logger.info("Report generation completed: %d sections, %d trends", len(sections), len(trends))
             
             return ReportGenerationResponse(
                 success=True,
@@ -297,13 +670,13 @@ class ReportGenerationService:
             )
             
         except Exception as e:
-            logger.error(f"Report generation failed: {e}")
+            logger.error("Report generation failed: %s", e)
             
             return ReportGenerationResponse(
                 success=False,
                 report=None,
                 error_message=str(e),
-                processing_time=time.time() - start_time,
+                processing_time=time.perf_counter() - start_time,
                 generation_cost=generation_cost,
                 articles_processed=0,
                 sections_generated=0
@@ -311,29 +684,9 @@ class ReportGenerationService:
     
     def _generate_title(self, request: ReportGenerationRequest) -> str:
         """Generate report title based on type and period."""
-        type_titles = {
-            ReportType.DAILY: "Daily AI News Digest",
-            ReportType.WEEKLY: "Weekly AI Industry Report", 
-            ReportType.MONTHLY: "Monthly AI Market Analysis",
-            ReportType.BREAKING: "Breaking AI News Alert",
-            ReportType.CUSTOM: "AI News Report"
-        }
-        
-        base_title = type_titles.get(request.report_type, "AI News Report")
-        
-        # Add date context
-        if request.report_type == ReportType.DAILY:
-            date_str = request.period_end.strftime("%B %d, %Y")
-            return f"{base_title} - {date_str}"
-        elif request.report_type == ReportType.WEEKLY:
-            week_start = request.period_start.strftime("%B %d")
-            week_end = request.period_end.strftime("%B %d, %Y")
-            return f"{base_title} - {week_start} to {week_end}"
-        elif request.report_type == ReportType.MONTHLY:
-            month_year = request.period_end.strftime("%B %Y")
-            return f"{base_title} - {month_year}"
-        
-        return base_title
+        return _format_report_title(
+            request.report_type, request.period_start.date(), request.period_end.date()
+        )
     
     async def _fetch_articles(self, request: ReportGenerationRequest) -> List[Any]:
         """Fetch articles for the report time period."""
@@ -341,26 +694,32 @@ class ReportGenerationService:
         # For now, return mock data structure
         mock_articles = []
         
-        # This would be replaced with actual database query:
-        # from sqlalchemy.orm import sessionmaker
-        # session = sessionmaker()
-        # articles = session.query(NewsArticle).filter(
-        #     NewsArticle.published_date.between(request.period_start, request.period_end),
-        #     NewsArticle.relevance_score >= request.min_relevance_score,
-        #     NewsArticle.quality_score >= request.min_quality_score
-        # ).order_by(NewsArticle.relevance_score.desc()).all()
+        # This would be replaced with a streamed database query, so rows are
+        # converted in partitions as they arrive instead of after one blocking load:
+        # from sqlalchemy import select
+        # from sqlalchemy.ext.asyncio import AsyncSession
+        # async with AsyncSession(engine) as session:
+        #     result = await session.stream(
+        #         select(NewsArticle).where(
+        #             NewsArticle.published_date.between(request.period_start, request.period_end),
+        #             NewsArticle.relevance_score >= request.min_relevance_score,
+        #             NewsArticle.quality_score >= request.min_quality_score
+        #         ).order_by(NewsArticle.relevance_score.desc())
+        #     )
+        #     async for partition in result.scalars().partitions(500):
+        #         mock_articles.extend(partition)
         
         return mock_articles
     
-    def _create_article_summary(self, article) -> ArticleSummary:
-        """Create article summary from database article."""
+    def _create_article_summary(self, article) -> ArticleSummaryRecord:
+        """Create article summary record from database article."""
         # Mock implementation - would use real article data
-        return ArticleSummary(
+        return ArticleSummaryRecord(
             article_id=article.id if hasattr(article, 'id') else "mock-id",
             title="Sample AI Article",
             url="https://example.com/article",
             source="TechCrunch",
-            published_date=datetime.now(timezone.utc),
+            published_date=datetime.now(_UTC),
             summary="This is a sample article summary for testing purposes.",
             relevance_score=0.85,
             quality_score=0.75,
@@ -373,50 +732,41 @@ class ReportGenerationService:
         )
     
     async def _organize_into_sections(self, 
-                                    articles: List[ArticleSummary], 
+                                    articles: List[ArticleSummaryRecord], 
                                     included_sections: List[ReportSection],
-                                    max_per_section: int) -> List[ReportSectionData]:
+                                    max_per_section: int,
+                                    columns: Optional[ArticleColumns] = None) -> List[ReportSectionData]:
         """Organize articles into report sections."""
         sections = []
+        columns = columns or ArticleColumns.from_summaries(articles)
         
-        # Section categorization logic
-        section_keywords = {
-            ReportSection.BREAKING_NEWS: ["breaking", "urgent", "alert", "just in"],
-            ReportSection.KEY_DEVELOPMENTS: ["announces", "launches", "releases", "introduces"],
-            ReportSection.RESEARCH_HIGHLIGHTS: ["research", "study", "paper", "findings", "arxiv"],
-            ReportSection.INDUSTRY_ANALYSIS: ["market", "industry", "analysis", "trends", "outlook"],
-            ReportSection.FUNDING_NEWS: ["funding", "investment", "raises", "series", "valuation"],
-            ReportSection.PRODUCT_LAUNCHES: ["product", "launch", "feature", "release", "beta"],
-            ReportSection.REGULATORY_UPDATES: ["regulation", "policy", "law", "compliance", "government"]
-        }
+        # Executive summary is handled separately
+        section_types = [s for s in included_sections if s != ReportSection.EXECUTIVE_SUMMARY]
+        section_articles: Dict[ReportSection, List[ArticleSummaryRecord]] = {s: [] for s in section_types}
+        patterns = [(s, self._section_patterns.get(s)) for s in section_types]
         
-        for section_type in included_sections:
-            if section_type == ReportSection.EXECUTIVE_SUMMARY:
-                continue  # Handled separately
-            
-            # Filter articles for this section
-            section_articles = []
-            keywords = section_keywords.get(section_type, [])
-            
-            for article in articles:
+        # Test each article's precomputed text against every section
+        for article, content_text in zip(articles, columns.lower_text):
+            for section_type, pattern in patterns:
                 # Check if article matches section criteria
-                content_text = f"{article.title} {article.summary}".lower()
-                if any(keyword in content_text for keyword in keywords):
-                    section_articles.append(article)
+                if pattern is not None and pattern.search(content_text):
+                    section_articles[section_type].append(article)
                 elif section_type == ReportSection.KEY_DEVELOPMENTS and article.impact_score > 0.7:
-                    section_articles.append(article)
+                    section_articles[section_type].append(article)
                 elif section_type == ReportSection.RESEARCH_HIGHLIGHTS and "research" in article.topics:
-                    section_articles.append(article)
-            
+                    section_articles[section_type].append(article)
+        
+        for section_type in section_types:
             # Sort by relevance and limit
-            section_articles.sort(key=lambda a: a.relevance_score, reverse=True)
-            section_articles = section_articles[:max_per_section]
+            matched = heapq.nlargest(
+                max_per_section, section_articles[section_type], key=lambda a: a.relevance_score
+            )
             
-            if section_articles:  # Only include sections with articles
-                section_data = ReportSectionData(
+            if matched:  # Only include sections with articles
+                section_data = ReportSectionData.construct_trusted(
                     section_type=section_type,
                     title=self._get_section_title(section_type),
-                    articles=section_articles,
+                    articles=[article.to_article_summary(trusted=True) for article in matched],
                     priority=self._get_section_priority(section_type)
                 )
                 sections.append(section_data)
@@ -428,63 +778,32 @@ class ReportGenerationService:
     
     def _get_section_title(self, section_type: ReportSection) -> str:
         """Get display title for section type."""
-        titles = {
-            ReportSection.BREAKING_NEWS: "🚨 Breaking News",
-            ReportSection.KEY_DEVELOPMENTS: "🔑 Key Developments",
-            ReportSection.RESEARCH_HIGHLIGHTS: "🔬 Research Highlights",
-            ReportSection.INDUSTRY_ANALYSIS: "📊 Industry Analysis",
-            ReportSection.FUNDING_NEWS: "💰 Funding & Investments",
-            ReportSection.PRODUCT_LAUNCHES: "🚀 Product Launches",
-            ReportSection.REGULATORY_UPDATES: "⚖️ Regulatory Updates",
-            ReportSection.TREND_ANALYSIS: "📈 Trend Analysis",
-            ReportSection.MARKET_IMPACT: "🎯 Market Impact"
-        }
-        return titles.get(section_type, section_type.value.replace("_", " ").title())
+        title = SECTION_TITLES.get(section_type)
+        return title if title is not None else section_type.value.replace("_", " ").title()
     
     def _get_section_priority(self, section_type: ReportSection) -> int:
         """Get display priority for section (lower = higher priority)."""
-        priorities = {
-            ReportSection.EXECUTIVE_SUMMARY: 1,
-            ReportSection.BREAKING_NEWS: 2,
-            ReportSection.KEY_DEVELOPMENTS: 3,
-            ReportSection.RESEARCH_HIGHLIGHTS: 4,
-            ReportSection.INDUSTRY_ANALYSIS: 5,
-            ReportSection.FUNDING_NEWS: 6,
-            ReportSection.PRODUCT_LAUNCHES: 7,
-            ReportSection.REGULATORY_UPDATES: 8,
-            ReportSection.TREND_ANALYSIS: 9,
-            ReportSection.MARKET_IMPACT: 10
-        }
-        return priorities.get(section_type, 5)
+        return SECTION_PRIORITIES.get(section_type, 5)
     
     async def _analyze_trends(self, 
-                            articles: List[ArticleSummary], 
-                            request: ReportGenerationRequest) -> List[TrendData]:
+                            articles: List[ArticleSummaryRecord], 
+                            request: ReportGenerationRequest,
+                            columns: Optional[ArticleColumns] = None) -> List[TrendData]:
         """Analyze trends in the articles."""
         trends = []
+        columns = columns or ArticleColumns.from_summaries(articles)
         
-        # Topic frequency analysis
-        topic_counts = Counter()
-        for article in articles:
-            for topic in article.topics:
-                topic_counts[topic] += 1
+        # Topic frequency, counted in a single C-level pass over the flattened lists
+        topic_counts = Counter(chain.from_iterable(map(_get_topics, articles)))
         
-        # Entity frequency analysis
-        entity_counts = Counter()
-        for article in articles:
-            for entity in article.entities:
-                entity_counts[entity] += 1
-        
-        # Sentiment trend analysis
         daily_sentiment = defaultdict(list)
-        for article in articles:
-            day = article.published_date.date()
+        for article, day in zip(articles, columns.dates):
             daily_sentiment[day].append(article.sentiment_score)
         
         # Create trend data (simplified)
         for topic, count in topic_counts.most_common(5):
             if count >= 3:  # Minimum threshold
-                trend = TrendData(
+                trend = TrendData.construct_trusted(
                     trend_name=f"{topic} Coverage",
                     trend_type="topic_frequency",
                     current_value=float(count),
@@ -499,11 +818,12 @@ class ReportGenerationService:
         return trends[:5]  # Limit to top 5 trends
     
     async def _generate_ai_summaries(self, 
-                                   articles: List[ArticleSummary],
+                                   articles: List[ArticleSummaryRecord],
                                    sections: List[ReportSectionData],
                                    trends: List[TrendData],
-                                   request: ReportGenerationRequest) -> ReportSummaryData:
-        """Generate AI-powered summaries and insights."""
+                                   request: ReportGenerationRequest,
+                                   columns: Optional[ArticleColumns] = None) -> Tuple[ReportSummaryData, int]:
+        """Generate AI-powered summaries and insights, with the cached prompt tokens they reused."""
         
         # Prepare context for AI agent
         article_context = "\n".join([
@@ -524,7 +844,7 @@ class ReportGenerationService:
         analysis_prompt = f"""
 Generate comprehensive summaries and insights for this {request.report_type.value} AI news report:
 
-REPORTING PERIOD: {request.period_start.strftime('%B %d, %Y')} to {request.period_end.strftime('%B %d, %Y')}
+REPORTING PERIOD: {format_display_date(request.period_start.date())} to {format_display_date(request.period_end.date())}
 
 ARTICLES ANALYZED ({len(articles)} total):
 {article_context}
@@ -539,39 +859,34 @@ Generate professional report content including executive summary, key insights,
 """
         
         try:
-            # Create dependencies
-            deps = ReportGenerationDeps(
-                cost_tracker=self.cost_tracker,
-                settings=self.settings,
-                template_env=self.template_env
-            )
-            
-            # Run AI analysis
-            result = await report_generation_agent.run(analysis_prompt, deps=deps)
-            return result.data
+            # Run AI analysis, batched with any concurrent reports
+            return await self._batch_summarizer.submit(analysis_prompt, self._deps)
             
         except Exception as e:
-            logger.warning(f"AI summary generation failed, using fallback: {e}")
-            return self._generate_fallback_summaries(articles, sections, trends)
+            logger.warning("AI summary generation failed, using fallback: %s", e)
+            return self._generate_fallback_summaries(articles, sections, trends, columns), 0
     
     def _generate_fallback_summaries(self, 
-                                   articles: List[ArticleSummary],
+                                   articles: List[ArticleSummaryRecord],
                                    sections: List[ReportSectionData],
-                                   trends: List[TrendData]) -> ReportSummaryData:
+                                   trends: List[TrendData],
+                                   columns: Optional[ArticleColumns] = None) -> ReportSummaryData:
         """Generate fallback summaries without AI."""
+        columns = columns or ArticleColumns.from_summaries(articles)
+        source_counts = columns.source_counts
         
         # Simple extractive summary
-        top_articles = sorted(articles, key=lambda a: a.relevance_score, reverse=True)[:3]
+        top_articles = heapq.nlargest(3, articles, key=lambda a: a.relevance_score)
         
         executive_summary = f"""
-This report covers {len(articles)} AI-related articles from {len(set(a.source for a in articles))} sources. 
+This report covers {len(articles)} AI-related articles from {len(source_counts)} sources. 
 Key developments include {', '.join(article.title[:50] + '...' for article in top_articles[:2])}.
 The analysis shows continued growth in AI research and industry applications.
         """.strip()
         
         key_insights = [
-            f"Analyzed {len(articles)} articles with average relevance score of {statistics.mean(a.relevance_score for a in articles):.2f}",
-            f"Top sources include {', '.join(Counter(a.source for a in articles).most_common(3)[0])}",
+            f"Analyzed {len(articles)} articles with average relevance score of {columns.avg_relevance:.2f}",
+            f"Top sources include {', '.join(source for source, _ in source_counts.most_common(3))}",
             "AI research and development continues to accelerate across multiple domains",
             "Industry adoption of AI technologies remains a key focus area"
         ]
@@ -591,16 +906,17 @@ The analysis shows continued growth in AI research and industry applications.
     async def _generate_html_content(self, report: Report, request: ReportGenerationRequest) -> str:
         """Generate HTML content for the report."""
         try:
-            # Use template if available
-            template_name = request.template_name or f"{request.report_type.value}_report.html"
-            
-            try:
-                template = self.template_env.get_template(template_name)
-            except:
-                # Use default template
+            # Use template if available, otherwise the default template
+            if request.template_name:
+                template = self._load_template(request.template_name)
+            else:
+                template = self.report_templates.get(request.report_type)
+            if template is None:
                 template = self._get_default_html_template()
             
-            return template.render(
+            # Rendering large autoescaped reports is CPU-bound; keep it off the event loop
+            return await asyncio.to_thread(
+                template.render,
                 report=report,
                 metadata=report.metadata,
                 sections=report.sections,
@@ -609,100 +925,55 @@ The analysis shows continued growth in AI research and industry applications.
             )
             
         except Exception as e:
-            logger.warning(f"HTML generation failed, using simple format: {e}")
+            logger.warning("HTML generation failed, using simple format: %s", e)
             return self._generate_simple_html(report)
     
     def _get_default_html_template(self) -> Template:
         """Get default HTML template."""
-        template_content = """
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <title>{{ metadata.title }}</title>
-    <style>
-        body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 800px; margin: 0 auto; padding: 20px; }
-        .header { text-align: center; border-bottom: 2px solid #2563eb; padding-bottom: 20px; margin-bottom: 30px; }
-        .section { margin-bottom: 40px; }
-        .article { border-left: 3px solid #e5e7eb; padding-left: 15px; margin-bottom: 20px; }
-        .metrics { background: #f3f4f6; padding: 15px; border-radius: 5px; margin: 20px 0; }
-        .trend { background: #fef3c7; padding: 10px; border-radius: 5px; margin: 10px 0; }
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>{{ metadata.title }}</h1>
-        <p>{{ metadata.period_start.strftime('%B %d, %Y') }} - {{ metadata.period_end.strftime('%B %d, %Y') }}</p>
-        <div class="metrics">
-            {{ metadata.total_articles }} articles | {{ metadata.sources_covered }} sources | 
-            Avg relevance: {{ "%.1f"|format(metadata.avg_relevance_score * 100) }}%
-        </div>
-    </div>
-    
-    <div class="section">
-        <h2>Executive Summary</h2>
-        <p>{{ report.executive_summary }}</p>
-    </div>
-    
-    {% for section in sections %}
-    <div class="section">
-        <h2>{{ section.title }}</h2>
-        {% for article in section.articles %}
-        <div class="article">
-            <h3><a href="{{ article.url }}">{{ article.title }}</a></h3>
-            <p><strong>{{ article.source }}</strong> | {{ article.published_date.strftime('%B %d, %Y') }}</p>
-            <p>{{ article.summary }}</p>
-        </div>
-        {% endfor %}
-    </div>
-    {% endfor %}
+        return self._default_html_template
     
-    {% if trends %}
-    <div class="section">
-        <h2>Trend Analysis</h2>
-        {% for trend in trends %}
-        <div class="trend">
-            <h3>{{ trend.trend_name }}</h3>
-            <p>{{ trend.description }}</p>
-        </div>
-        {% endfor %}
-    </div>
-    {% endif %}
-</body>
-</html>
-        """
-        return Template(template_content)
+    def _format_period(self, metadata: ReportMetadata) -> str:
+        """Format the reporting period for display."""
+        return f"{format_display_date(metadata.period_start.date())} - {format_display_date(metadata.period_end.date())}"
     
     def _generate_simple_html(self, report: Report) -> str:
         """Generate simple HTML fallback."""
-        html = f"""
+        period = self._format_period(report.metadata)
+        
+        parts: List[str] = [f"""
         <html>
         <body>
         <h1>{report.metadata.title}</h1>
-        <p><strong>Period:</strong> {report.metadata.period_start.strftime('%B %d, %Y')} - {report.metadata.period_end.strftime('%B %d, %Y')}</p>
+        <p><strong>Period:</strong> {period}</p>
         <h2>Executive Summary</h2>
         <p>{report.executive_summary}</p>
-        """
+        """]
+        append = parts.append
         
         for section in report.sections:
-            html += f"<h2>{section.title}</h2>"
+            append(f"<h2>{section.title}</h2>")
             for article in section.articles[:3]:
-                html += f"""
+                append(f"""
                 <div>
                     <h3><a href="{article.url}">{article.title}</a></h3>
-                    <p><strong>{article.source}</strong> | {article.published_date.strftime('%B %d, %Y')}</p>
+                    <p><strong>{article.source}</strong> | {article.published_date_str}</p>
                     <p>{article.summary}</p>
                 </div>
-                """
+                """)
         
-        html += "</body></html>"
-        return html
+        append("</body></html>")
+        return "".join(parts)
     
-    def _generate_markdown_content(self, report: Report) -> str:
-        """Generate markdown content."""
-        md = f"""# {report.metadata.title}
+    def _generate_markdown_content(self, report: Report, body: Optional[str] = None) -> str:
+        """Generate markdown content, reusing a pre-rendered section body if given."""
+        if body is None:
+            body = self._render_markdown_body(report.sections, report.trends)
+        
+        period = self._format_period(report.metadata)
+        
+        return f"""# {report.metadata.title}
 
-**Period:** {report.metadata.period_start.strftime('%B %d, %Y')} - {report.metadata.period_end.strftime('%B %d, %Y')}
+**Period:** {period}
 
 **Report Metrics:** {report.metadata.total_articles} articles | {report.metadata.sources_covered} sources | Avg relevance: {report.metadata.avg_relevance_score*100:.1f}%
 
@@ -710,98 +981,170 @@ The analysis shows continued growth in AI research and industry applications.
 
 {report.executive_summary}
 
-"""
-        
-        for section in report.sections:
-            md += f"\n## {section.title}\n\n"
+""" + body
+    
+    def _render_markdown_body(self, sections: List[ReportSectionData], trends: List[TrendData]) -> str:
+        """Render the summary-independent markdown sections and trends."""
+        parts: List[str] = []
+        append = parts.append
+        for section in sections:
+            append(f"\n## {section.title}\n\n")
             for article in section.articles:
-                md += f"""### [{article.title}]({article.url})
-**{article.source}** | {article.published_date.strftime('%B %d, %Y')}
+                append(f"""### [{article.title}]({article.url})
+**{article.source}** | {article.published_date_str}
 
 {article.summary}
 
-"""
+""")
         
-        if report.trends:
-            md += "\n## Trend Analysis\n\n"
-            for trend in report.trends:
-                md += f"**{trend.trend_name}:** {trend.description}\n\n"
+        if trends:
+            append(MARKDOWN_TREND_HEADER)
+            for trend in trends:
+                append(f"**{trend.trend_name}:** {trend.description}\n\n")
         
-        return md
+        return "".join(parts)
     
-    def _generate_text_content(self, report: Report) -> str:
-        """Generate plain text content."""
-        text = f"""{report.metadata.title}
+    def _generate_text_content(self, report: Report, body: Optional[str] = None) -> str:
+        """Generate plain text content, reusing a pre-rendered section body if given."""
+        if body is None:
+            body = self._render_text_body(report.sections)
+        
+        period = self._format_period(report.metadata)
+        
+        return f"""{report.metadata.title}
 {'='*len(report.metadata.title)}
 
-Period: {report.metadata.period_start.strftime('%B %d, %Y')} - {report.metadata.period_end.strftime('%B %d, %Y')}
+Period: {period}
 
-EXECUTIVE SUMMARY
------------------
-{report.executive_summary}
+{TEXT_SUMMARY_HEADER}{report.executive_summary}
 
-"""
-        
-        for section in report.sections:
-            text += f"\n{section.title.upper()}\n{'-'*len(section.title)}\n\n"
+""" + body
+    
+    def _render_text_body(self, sections: List[ReportSectionData]) -> str:
+        """Render the summary-independent plain text sections."""
+        parts: List[str] = []
+        append = parts.append
+        for section in sections:
+            append(_text_section_heading(section.title))
             for article in section.articles:
-                text += f"{article.title}\n{article.source} | {article.published_date.strftime('%B %d, %Y')}\n{article.url}\n\n{article.summary}\n\n"
+                append(f"{article.title}\n{article.source} | {article.published_date_str}\n{article.url}\n\n{article.summary}\n\n")
         
-        return text
+        return "".join(parts)
     
     async def _deliver_report(self, report: Report, request: ReportGenerationRequest):
-        """Deliver report via email."""
+        """Deliver report via email, fanning recipient batches out concurrently."""
         if not request.recipients:
             return None
         
-        # Create email request
-        email_request = TemplateEmailRequest(
-            template_name="daily_report",  # Would be dynamic based on report type
-            to_addresses=request.recipients,
-            subject=report.metadata.title,
-            template_data={
-                "report": report,
-                "metadata": report.metadata,
-                "sections": report.sections,
-                "trends": report.trends,
-                "title": report.metadata.title,
-                "period_start": report.metadata.period_start,
-                "period_end": report.metadata.period_end,
-                "total_articles": report.metadata.total_articles,
-                "sources_covered": report.metadata.sources_covered,
-                "avg_relevance": report.metadata.avg_relevance_score,
-                "executive_summary": report.executive_summary,
-                "key_insights": report.key_insights
-            }
+        start_time = time.perf_counter()
+        # Render the email template once and reuse it for every recipient batch
+        html_content = await self._render_report_email(report)
+        if html_content is None:
+            return ReportDeliveryResponse(
+                success=False,
+                failed_count=len(request.recipients),
+                delivery_errors=["Report email rendering failed"],
+                delivery_time=time.perf_counter() - start_time
+            )
+        
+        semaphore = asyncio.Semaphore(EMAIL_DELIVERY_CONCURRENCY)
+        
+        async def send_batch(recipients: List[str]):
+            async with semaphore:
+                return await send_email(EmailRequest(
+                    to_addresses=recipients,
+                    subject=report.metadata.title,
+                    html_content=html_content,
+                    text_content=report.text_content
+                ))
+        
+        batches = [
+            request.recipients[i:i + EMAIL_RECIPIENT_BATCH_SIZE]
+            for i in range(0, len(request.recipients), EMAIL_RECIPIENT_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(*(send_batch(batch) for batch in batches), return_exceptions=True)
+        
+        delivered_count = 0
+        failed_count = 0
+        delivery_errors = []
+        for batch, result in zip(batches, results):
+            if isinstance(result, Exception):
+                failed_count += len(batch)
+                delivery_errors.append(str(result))
+            else:
+                delivered_count += result.sent_count
+                failed_count += result.failed_count
+                delivery_errors.extend(result.errors)
+        
+        return ReportDeliveryResponse(
+            success=failed_count == 0,
+            delivered_count=delivered_count,
+            failed_count=failed_count,
+            delivered_at=datetime.now(_UTC) if delivered_count else None,
+            delivery_errors=delivery_errors,
+            delivery_time=time.perf_counter() - start_time,
+            email_size_kb=len(html_content.encode()) / 1024
         )
+    
+    async def _render_report_email(self, report: Report) -> Optional[str]:
+        """Render the delivery email template for a report, or None if rendering fails."""
+        template_data = {
+            "report": report,
+            "metadata": report.metadata,
+            "sections": report.sections,
+            "trends": report.trends,
+            "title": report.metadata.title,
+            "period_start": report.metadata.period_start,
+            "period_end": report.metadata.period_end,
+            "total_articles": report.metadata.total_articles,
+            "sources_covered": report.metadata.sources_covered,
+            "avg_relevance": report.metadata.avg_relevance_score,
+            "executive_summary": report.executive_summary,
+            "key_insights": report.key_insights
+        }
         
-        return await send_templated_email(email_request)
+        try:
+            # Render the cached template for this report type off the event loop
+            template = self._get_email_template(report.metadata.report_type)
+            return await asyncio.to_thread(template.render, **template_data)
+        except TemplateError as e:
+            logger.error("Report email rendering failed: %s", e)
+            return None
+    
+    def _get_email_template(self, report_type: ReportType) -> Template:
+        """Get the compiled delivery email template for a report type."""
+        template = self._email_templates.get(report_type)
+        if template is None:
+            # Report-type specific template if present, otherwise the daily layout
+            template = email_service.template_env.select_template(
+                [f"{report_type.value}_report.html", "daily_report.html"]
+            )
+            self._email_templates[report_type] = template
+        return template
     
     def _calculate_completeness(self, report: Report) -> float:
         """Calculate report completeness score."""
-        completeness_factors = [
-            bool(report.executive_summary),
-            bool(report.key_insights),
-            len(report.sections) > 0,
-            bool(report.html_content),
-            len(report.sections) >= 3,
-            bool(report.trends),
-            bool(report.recommendations)
-        ]
+        # One bit per completeness factor, scored as the fraction of bits set
+        section_count = len(report.sections)
+        completeness_flags = (
+            bool(report.executive_summary)
+            | bool(report.key_insights) << 1
+            | (section_count > 0) << 2
+            | bool(report.html_content) << 3
+            | (section_count >= 3) << 4
+            | bool(report.trends) << 5
+            | bool(report.recommendations) << 6
+        )
         
-        return sum(completeness_factors) / len(completeness_factors)
+        return completeness_flags.bit_count() / COMPLETENESS_FACTOR_COUNT
     
     def _calculate_readability(self, report: Report) -> float:
         """Calculate report readability score."""
-        # Simple readability metric based on sentence length and complexity
-        total_words = 0
-        total_sentences = 0
-        
-        for section in report.sections:
-            words = len(section.content.split())
-            sentences = section.content.count('.') + section.content.count('!') + section.content.count('?')
-            total_words += words
-            total_sentences += sentences
+        # Simple readability metric based on sentence length and complexity;
+        # word counts are cached per section, sentence terminators counted in one scan
+        total_words = sum(section.word_count for section in report.sections)
+        content = "\n".join(section.content for section in report.sections)
+        total_sentences = len(content) - len(content.translate(_DELETE_SENTENCE_ENDS))
         
         if total_sentences == 0:
             return 0.5
@@ -841,6 +1184,7 @@ async def generate_report(request: ReportGenerationRequest) -> ReportGenerationR
 # Export main components
 __all__ = [
     'report_generation_agent',
+    'BatchReportSummarizer',
     'ReportGenerationService',
     'generate_report',
     'get_report_generation_service'
@@ -4,12 +4,51 @@ Data models for the Report Generation Agent.
 Defines structures for report creation, formatting, and delivery.
 """
 
-from typing import List, Optional, Dict, Any, Union
-from datetime import datetime, date
+from typing import List, Optional, Dict, Any, NamedTuple, Tuple, Union
+from dataclasses import dataclass, field
+from datetime import datetime, date, timezone
+from functools import cached_property, lru_cache
+import heapq
+import sys
+import time
 from enum import Enum
 from uuid import UUID, uuid4
-from pydantic import BaseModel, Field, validator, EmailStr
-import json
+from pydantic import BaseModel, ConfigDict, Field, field_validator, validator, model_validator, validate_email
+
+
+# Last (epoch second, UTC datetime) handed out by utc_now_coarse
+_coarse_now: Tuple[int, Optional[datetime]] = (0, None)
+
+
+def utc_now_coarse() -> datetime:
+    """
+    Current UTC time at one-second resolution.
+    
+    Default for log-grade timestamps; models built within the same second
+    share one datetime instead of each allocating their own.
+    """
+    global _coarse_now
+    second = int(time.time())
+    if second != _coarse_now[0]:
+        _coarse_now = (second, datetime.fromtimestamp(second, timezone.utc))
+    return _coarse_now[1]
+
+
+@lru_cache(maxsize=1024)
+def format_display_date(day: date) -> str:
+    """Format a calendar day for display; most report dates repeat, so each is formatted once."""
+    return day.strftime('%B %d, %Y')
+
+
+@lru_cache(maxsize=4096)
+def normalize_recipient(address: str) -> str:
+    """
+    Validate and normalize an email address, as EmailStr does.
+    
+    Recurring reports go to the same recipients, so repeat addresses skip
+    re-validation.
+    """
+    return validate_email(address)[1]
 
 
 class ReportType(str, Enum):
@@ -64,6 +103,9 @@ class ReportSection(str, Enum):
 
 class ArticleSummary(BaseModel):
     """Article summary for inclusion in reports."""
+    # Allocated per article and never mutated once built
+    model_config = ConfigDict(frozen=True)
+    
     article_id: UUID
     title: str = Field(..., max_length=200)
     url: str
@@ -93,10 +135,93 @@ class ArticleSummary(BaseModel):
         if 'word_count' in values and values['word_count'] > 0:
             return max(1, values['word_count'] // 200)  # Assume 200 WPM
         return v
+    
+    @field_validator('source')
+    def intern_source(cls, v):
+        """Share one string per source name across articles."""
+        return sys.intern(v)
+    
+    @field_validator('entities', 'topics')
+    def intern_labels(cls, v):
+        """Share one string per distinct entity or topic across articles."""
+        return [sys.intern(label) for label in v]
+    
+    @cached_property
+    def published_date_str(self) -> str:
+        """Display date, formatted once and reused by every output format."""
+        return format_display_date(self.published_date.date())
+
+
+@dataclass(slots=True)
+class ArticleSummaryRecord:
+    """
+    Unvalidated article summary for internal report assembly.
+    
+    Carries the same fields as ArticleSummary; only the articles that end
+    up in a report section are converted to the validated model.
+    """
+    article_id: UUID
+    title: str
+    url: str
+    source: str
+    published_date: datetime
+    relevance_score: float
+    quality_score: float
+    impact_score: float
+    sentiment_score: float
+    summary: str
+    author: Optional[str] = None
+    key_points: List[str] = field(default_factory=list)
+    entities: List[str] = field(default_factory=list)
+    topics: List[str] = field(default_factory=list)
+    word_count: int = 0
+    
+    def __post_init__(self):
+        """Share one string per source, entity and topic across records."""
+        self.source = sys.intern(self.source)
+        self.entities = [sys.intern(entity) for entity in self.entities]
+        self.topics = [sys.intern(topic) for topic in self.topics]
+    
+    @property
+    def reading_time_minutes(self) -> int:
+        """Reading time based on word count, as on ArticleSummary."""
+        return max(1, self.word_count // 200) if self.word_count > 0 else 0
+    
+    @property
+    def published_date_str(self) -> str:
+        """Display date, as on ArticleSummary."""
+        return format_display_date(self.published_date.date())
+    
+    def to_article_summary(self, trusted: bool = False) -> ArticleSummary:
+        """Convert into an ArticleSummary, validating unless the record is trusted."""
+        fields = {
+            'article_id': self.article_id,
+            'title': self.title,
+            'url': self.url,
+            'source': self.source,
+            'published_date': self.published_date,
+            'author': self.author,
+            'relevance_score': self.relevance_score,
+            'quality_score': self.quality_score,
+            'impact_score': self.impact_score,
+            'sentiment_score': self.sentiment_score,
+            'summary': self.summary,
+            'key_points': self.key_points,
+            'entities': self.entities,
+            'topics': self.topics,
+            'word_count': self.word_count
+        }
+        if trusted:
+            return ArticleSummary.model_construct(
+                reading_time_minutes=self.reading_time_minutes, **fields
+            )
+        return ArticleSummary(**fields)
 
 
 class ReportSectionData(BaseModel):
     """Data for a specific report section."""
+    model_config = ConfigDict(frozen=True)
+    
     section_type: ReportSection
     title: str
     content: str = Field(default="", description="Main section content")
@@ -116,26 +241,42 @@ class ReportSectionData(BaseModel):
     template_name: Optional[str] = Field(None, description="Custom template")
     styling: Dict[str, Any] = Field(default_factory=dict)
     
-    @validator('article_count', pre=True, always=True)
-    def update_article_count(cls, v, values):
-        """Update article count based on articles list."""
-        if 'articles' in values:
-            return len(values['articles'])
-        return v
-    
-    @validator('avg_relevance', 'avg_quality', pre=True, always=True)
-    def calculate_averages(cls, v, values, field):
-        """Calculate average scores from articles."""
-        if 'articles' in values and values['articles']:
-            if field.name == 'avg_relevance':
-                return sum(a.relevance_score for a in values['articles']) / len(values['articles'])
-            elif field.name == 'avg_quality':
-                return sum(a.quality_score for a in values['articles']) / len(values['articles'])
-        return v
+    @model_validator(mode='before')
+    @classmethod
+    def aggregate_articles(cls, data: Any) -> Any:
+        """Derive the article count and average scores in a single pass over the articles."""
+        if isinstance(data, dict) and 'articles' in data:
+            articles = data['articles']
+            data = dict(data)
+            data['article_count'] = len(articles)
+            if articles:
+                relevance = quality = 0.0
+                for article in articles:
+                    if isinstance(article, dict):
+                        relevance += article.get('relevance_score', 0.0)
+                        quality += article.get('quality_score', 0.0)
+                    else:
+                        relevance += article.relevance_score
+                        quality += article.quality_score
+                data['avg_relevance'] = relevance / len(articles)
+                data['avg_quality'] = quality / len(articles)
+        return data
+    
+    @cached_property
+    def word_count(self) -> int:
+        """Words in the section content; the section is frozen, so this is split once."""
+        return len(self.content.split())
+    
+    @classmethod
+    def construct_trusted(cls, **fields: Any) -> "ReportSectionData":
+        """Build a section without field validation, still deriving its article statistics."""
+        return cls.model_construct(**cls.aggregate_articles(fields))
 
 
 class TrendData(BaseModel):
     """Trend analysis data."""
+    model_config = ConfigDict(frozen=True)
+    
     trend_name: str
     trend_type: str = Field(..., description="Type of trend (topic, sentiment, etc.)")
     current_value: float
@@ -153,28 +294,32 @@ class TrendData(BaseModel):
     implications: List[str] = Field(default_factory=list, max_items=3)
     supporting_articles: List[UUID] = Field(default_factory=list)
     
-    @validator('change_percentage', pre=True, always=True)
-    def calculate_change(cls, v, values):
-        """Calculate percentage change."""
-        if 'current_value' in values and 'previous_value' in values:
-            current = values['current_value']
-            previous = values['previous_value']
-            if previous != 0:
-                return ((current - previous) / previous) * 100
-        return v
-    
-    @validator('change_direction', pre=True, always=True)
-    def determine_direction(cls, v, values):
-        """Determine trend direction."""
-        if 'change_percentage' in values:
-            change = values['change_percentage']
-            if change > 2:
-                return "up"
-            elif change < -2:
-                return "down"
-            else:
-                return "stable"
-        return v
+    @model_validator(mode='before')
+    @classmethod
+    def derive_change(cls, data: Any) -> Any:
+        """Derive the change percentage and direction from current and previous values in one step."""
+        if isinstance(data, dict):
+            data = dict(data)
+            current = data.get('current_value')
+            previous = data.get('previous_value')
+            if current is not None and previous:
+                previous = float(previous)
+                data['change_percentage'] = ((float(current) - previous) / previous) * 100
+            change = data.get('change_percentage')
+            if change is not None:
+                change = float(change)
+                if change > 2:
+                    data['change_direction'] = "up"
+                elif change < -2:
+                    data['change_direction'] = "down"
+                else:
+                    data['change_direction'] = "stable"
+        return data
+    
+    @classmethod
+    def construct_trusted(cls, **fields: Any) -> "TrendData":
+        """Build a trend without field validation, still deriving its change and direction."""
+        return cls.model_construct(**cls.derive_change(fields))
 
 
 class ReportMetadata(BaseModel):
@@ -187,7 +332,7 @@ class ReportMetadata(BaseModel):
     # Time period
     period_start: datetime
     period_end: datetime
-    generated_at: datetime = Field(default_factory=datetime.utcnow)
+    generated_at: datetime = Field(default_factory=utc_now_coarse)
     
     # Content statistics
     total_articles: int = Field(default=0, ge=0)
@@ -207,17 +352,34 @@ class ReportMetadata(BaseModel):
     
     # Delivery information
     status: ReportStatus = Field(default=ReportStatus.PENDING)
-    recipients: List[EmailStr] = Field(default_factory=list)
+    recipients: List[str] = Field(default_factory=list)
     delivery_scheduled: Optional[datetime] = None
     delivered_at: Optional[datetime] = None
     delivery_attempts: int = Field(default=0, ge=0)
     delivery_errors: List[str] = Field(default_factory=list)
+    
+    @field_validator('recipients')
+    def validate_recipients(cls, v):
+        """Validate recipient addresses, reusing results for addresses seen before."""
+        return [normalize_recipient(address) for address in v]
+
+
+class ReportAggregates(NamedTuple):
+    """Section-derived report statistics, computed in one walk over the sections."""
+    word_count: int
+    top_articles: List[ArticleSummary]
+    section_by_type: Dict[ReportSection, ReportSectionData]
+
+
+# Report fields that _aggregates is derived from
+_AGGREGATE_INPUTS = frozenset({'sections', 'executive_summary'})
 
 
 class Report(BaseModel):
     """Complete report with all sections and metadata."""
     metadata: ReportMetadata
-    sections: List[ReportSectionData] = Field(default_factory=list)
+    # A tuple, so sections can only change by reassignment (which resets _aggregates)
+    sections: Tuple[ReportSectionData, ...] = Field(default=())
     trends: List[TrendData] = Field(default_factory=list)
     
     # Generated content
@@ -235,13 +397,41 @@ class Report(BaseModel):
     attachments: List[str] = Field(default_factory=list)
     external_links: List[str] = Field(default_factory=list)
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _AGGREGATE_INPUTS:
+            self.__dict__.pop('_aggregates', None)
+        super().__setattr__(name, value)
+    
+    @cached_property
+    def _aggregates(self) -> ReportAggregates:
+        """
+        Word count, top articles and the section index, from a single pass over the sections.
+        
+        Cached on first read and dropped whenever sections or the executive
+        summary are reassigned.
+        """
+        # Approximate word counts (spaces + 1) are plenty for reading-time estimates
+        word_count = (self.executive_summary.count(' ') + 1) if self.executive_summary else 0
+        section_by_type = {}
+        seen_ids = set()
+        unique_articles = []
+        for section in self.sections:
+            if section.content:
+                word_count += section.content.count(' ') + 1
+            section_by_type[section.section_type] = section
+            for article in section.articles:
+                if article.article_id not in seen_ids:
+                    seen_ids.add(article.article_id)
+                    unique_articles.append(article)
+        
+        # Keep the ten most relevant without sorting the rest
+        top_articles = heapq.nlargest(10, unique_articles, key=lambda a: a.relevance_score)
+        return ReportAggregates(word_count, top_articles, section_by_type)
+    
     @property
     def total_word_count(self) -> int:
         """Calculate total word count across all sections."""
-        total = len(self.executive_summary.split())
-        for section in self.sections:
-            total += len(section.content.split())
-        return total
+        return self._aggregates.word_count
     
     @property
     def estimated_reading_time(self) -> int:
@@ -251,24 +441,22 @@ class Report(BaseModel):
     @property
     def section_by_type(self) -> Dict[ReportSection, ReportSectionData]:
         """Get sections indexed by type."""
-        return {section.section_type: section for section in self.sections}
+        return self._aggregates.section_by_type
     
     @property
     def top_articles(self) -> List[ArticleSummary]:
         """Get top articles across all sections by relevance."""
-        all_articles = []
-        for section in self.sections:
-            all_articles.extend(section.articles)
-        
-        # Remove duplicates and sort by relevance
-        seen_ids = set()
-        unique_articles = []
-        for article in all_articles:
-            if article.article_id not in seen_ids:
-                seen_ids.add(article.article_id)
-                unique_articles.append(article)
-        
-        return sorted(unique_articles, key=lambda a: a.relevance_score, reverse=True)[:10]
+        return self._aggregates.top_articles
+
+
+# Defaults for report requests, shared instead of rebuilt per request
+DEFAULT_REPORT_SECTIONS = (
+    ReportSection.EXECUTIVE_SUMMARY,
+    ReportSection.KEY_DEVELOPMENTS,
+    ReportSection.RESEARCH_HIGHLIGHTS,
+    ReportSection.INDUSTRY_ANALYSIS
+)
+DEFAULT_OUTPUT_FORMATS = (ReportFormat.HTML, ReportFormat.EMAIL)
 
 
 class ReportGenerationRequest(BaseModel):
@@ -287,21 +475,16 @@ class ReportGenerationRequest(BaseModel):
     max_articles_per_section: int = Field(default=10, ge=1, le=50)
     
     # Section configuration
-    included_sections: List[ReportSection] = Field(default_factory=lambda: [
-        ReportSection.EXECUTIVE_SUMMARY,
-        ReportSection.KEY_DEVELOPMENTS,
-        ReportSection.RESEARCH_HIGHLIGHTS,
-        ReportSection.INDUSTRY_ANALYSIS
-    ])
+    included_sections: List[ReportSection] = Field(default_factory=lambda: list(DEFAULT_REPORT_SECTIONS))
     
     # Output configuration
-    output_formats: List[ReportFormat] = Field(default_factory=lambda: [ReportFormat.HTML, ReportFormat.EMAIL])
+    output_formats: List[ReportFormat] = Field(default_factory=lambda: list(DEFAULT_OUTPUT_FORMATS))
     include_trends: bool = Field(default=True)
     include_charts: bool = Field(default=False)
     include_full_articles: bool = Field(default=False)
     
     # Delivery options
-    recipients: List[EmailStr] = Field(default_factory=list)
+    recipients: List[str] = Field(default_factory=list)
     schedule_delivery: Optional[datetime] = None
     send_immediately: bool = Field(default=False)
     
@@ -310,6 +493,11 @@ class ReportGenerationRequest(BaseModel):
     generation_model: str = Field(default="gpt-5-mini")
     template_name: Optional[str] = None
     custom_styling: Dict[str, Any] = Field(default_factory=dict)
+    
+    @field_validator('recipients')
+    def validate_recipients(cls, v):
+        """Validate recipient addresses, reusing results for addresses seen before."""
+        return [normalize_recipient(address) for address in v]
 
 
 class ReportGenerationResponse(BaseModel):
@@ -337,7 +525,7 @@ class ReportGenerationResponse(BaseModel):
 class ReportDeliveryRequest(BaseModel):
     """Request for report delivery."""
     report_id: UUID
-    recipients: List[EmailStr]
+    recipients: List[str]
     delivery_time: Optional[datetime] = None
     
     # Email configuration
@@ -349,6 +537,11 @@ class ReportDeliveryRequest(BaseModel):
     retry_on_failure: bool = Field(default=True)
     max_retries: int = Field(default=3, ge=1, le=10)
     notification_webhook: Optional[str] = None
+    
+    @field_validator('recipients')
+    def validate_recipients(cls, v):
+        """Validate recipient addresses, reusing results for addresses seen before."""
+        return [normalize_recipient(address) for address in v]
 
 
 class ReportDeliveryResponse(BaseModel):
@@ -387,7 +580,7 @@ class ReportTemplate(BaseModel):
     supported_formats: List[ReportFormat] = Field(default_factory=lambda: [ReportFormat.HTML, ReportFormat.EMAIL])
     
     # Metadata
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now_coarse)
     created_by: str = Field(default="system")
     tags: List[str] = Field(default_factory=list)
 
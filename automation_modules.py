@@ -9,10 +9,10 @@ import asyncio
 import logging
 import time
 import os
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, NamedTuple, Optional, Any, Tuple
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -31,12 +31,25 @@ from scripts.rss_with_database_save import RSSWithDatabaseSaver
 from agents.content_analysis.agent import get_content_analysis_service
 from agents.content_analysis.models import AnalysisRequest, ContentType
 from database.models import Article, NewsSource, Report, ReportArticle, CostTracking, Alert
-from sqlalchemy import create_engine, and_, or_, desc, func
-from sqlalchemy.orm import sessionmaker, selectinload
+from database.session import get_engine, get_session_factory
+from sqlalchemy import bindparam, and_, or_, desc, func, insert, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import load_only, selectinload
 
 console = Console()
 logger = logging.getLogger(__name__)
 
+# Analysis results written per UPDATE/INSERT batch and commit
+ANALYSIS_WRITE_BATCH_SIZE = 100
+
+
+class ReportStats(NamedTuple):
+    """Article counts and average scores for a report period, computed in SQL."""
+    total_count: int
+    analyzed_count: int
+    avg_relevance: float
+    avg_quality: float
+
 
 class AutomationModules:
     """Modular automation functions that can run independently."""
@@ -44,18 +57,12 @@ class AutomationModules:
     def __init__(self):
         """Initialize automation modules."""
         self.settings = get_settings()
-        self.rss_saver = RSSWithDatabaseSaver()
+        self.rss_saver = RSSWithDatabaseSaver(engine=get_engine())
         self.content_service = None  # Lazy load
-        self._engine = None
-        self._Session = None
         
     def _get_session(self):
-        """Get database session, creating engine if needed."""
-        if self._Session is None:
-            db_url = self.settings.database_url.get_secret_value()
-            self._engine = create_engine(db_url, echo=False)
-            self._Session = sessionmaker(bind=self._engine)
-        return self._Session()
+        """Get database session from the shared connection pool."""
+        return get_session_factory()()
     
     def _get_content_service(self):
         """Get content analysis service, lazy loading."""
@@ -179,68 +186,81 @@ class AutomationModules:
             failed_count = 0
             total_cost = 0.0
             discovered_categories = set()
-            
-            # Process in batches to show progress
-            batch_size = 10
-            for i in range(0, len(unanalyzed), batch_size):
-                batch = unanalyzed[i:i+batch_size]
+            pending = []
+            
+            def record_analyzed(analysis, cost):
+                nonlocal analyzed_count, total_cost
+                analyzed_count += 1
+                total_cost += cost
+                # Track discovered categories
+                if getattr(analysis, 'primary_category', None):
+                    discovered_categories.add(analysis.primary_category)
+                if getattr(analysis, 'ai_domains', None):
+                    discovered_categories.update(analysis.ai_domains)
+            
+            def flush_pending():
+                """Write buffered results in one batch and tally the outcome."""
+                nonlocal failed_count
+                if not pending:
+                    return
+                if self.update_articles_analysis_batch(pending):
+                    for _, analysis, cost in pending:
+                        record_analyzed(analysis, cost)
+                else:
+                    # Keep the good (already paid for) results: retry row by row
+                    # so only the offending articles fail
+                    logger.warning(f"Batch write failed, retrying {len(pending)} articles individually")
+                    for article, analysis, cost in pending:
+                        if self.update_article_analysis_enhanced(article.id, analysis, cost):
+                            record_analyzed(analysis, cost)
+                        else:
+                            failed_count += 1
+                pending.clear()
+            
+            semaphore = asyncio.Semaphore(self.settings.analysis_max_concurrent)
+            
+            async def analyze_one(article):
+                """Analyze one article, falling back to keyword analysis if the AI call fails."""
+                # Prepare content for analysis
+                content_text = article.content or article.summary or article.title
+                if not content_text or len(content_text.strip()) < 10:
+                    if verbose:
+                        console.print(f"⚠️  Skipping article {article.id}: insufficient content", style="yellow")
+                    return None
+                
+                # Create analysis request
+                request = AnalysisRequest(
+                    content=content_text,
+                    content_type=ContentType.ARTICLE,
+                    content_id=str(article.id),
+                    extract_entities=True,
+                    identify_topics=True
+                )
+                
+                # Perform analysis, capping in-flight API requests
+                async with semaphore:
+                    analysis_response = await content_service.analyze_content(request)
+                
+                if analysis_response.success and analysis_response.analysis:
+                    return article, analysis_response.analysis, analysis_response.analysis_cost
+                # Use simple fallback analysis when AI fails
+                return article, self._create_fallback_analysis(article), 0.0  # No cost for fallback
+            
+            # Analyze each write batch concurrently, then store it in one transaction
+            for i in range(0, len(unanalyzed), ANALYSIS_WRITE_BATCH_SIZE):
+                batch = unanalyzed[i:i+ANALYSIS_WRITE_BATCH_SIZE]
                 if verbose and i > 0:
                     console.print(f"   Progress: {i}/{len(unanalyzed)} articles processed...", style="dim")
                 
-                for article in batch:
-                    try:
-                        # Prepare content for analysis
-                        content_text = article.content or article.summary or article.title
-                        if not content_text or len(content_text.strip()) < 10:
-                            if verbose:
-                                console.print(f"⚠️  Skipping article {article.id}: insufficient content", style="yellow")
-                            continue
-                        
-                        # Create analysis request
-                        request = AnalysisRequest(
-                            content=content_text,
-                            content_type=ContentType.ARTICLE,
-                            content_id=str(article.id),
-                            extract_entities=True,
-                            identify_topics=True
-                        )
-                        
-                        # Perform analysis
-                        analysis_response = await content_service.analyze_content(request)
-                        
-                        if analysis_response.success and analysis_response.analysis:
-                            # Update article with analysis results and track cost
-                            success = self.update_article_analysis_enhanced(
-                                article.id, 
-                                analysis_response.analysis,
-                                analysis_response.analysis_cost
-                            )
-                            if success:
-                                analyzed_count += 1
-                                total_cost += analysis_response.analysis_cost
-                                
-                                # Track discovered categories
-                                if hasattr(analysis_response.analysis, 'primary_category'):
-                                    discovered_categories.add(analysis_response.analysis.primary_category)
-                                if hasattr(analysis_response.analysis, 'ai_domains'):
-                                    discovered_categories.update(analysis_response.analysis.ai_domains)
-                        else:
-                            # Use simple fallback analysis when AI fails
-                            fallback_analysis = self._create_fallback_analysis(article)
-                            success = self.update_article_analysis_enhanced(
-                                article.id,
-                                fallback_analysis,
-                                0.0  # No cost for fallback
-                            )
-                            if success:
-                                analyzed_count += 1
-                                discovered_categories.add(fallback_analysis.primary_category)
-                            else:
-                                failed_count += 1
-                            
-                    except Exception as e:
-                        logger.warning(f"Failed to analyze article {article.id}: {e}")
+                results = await asyncio.gather(*(analyze_one(a) for a in batch), return_exceptions=True)
+                for article, result in zip(batch, results):
+                    if isinstance(result, Exception):
+                        logger.warning(f"Failed to analyze article {article.id}: {result}")
                         failed_count += 1
+                    elif result is not None:
+                        pending.append(result)
+                
+                flush_pending()
             
             processing_time = time.time() - start_time
             
@@ -293,7 +313,7 @@ class AutomationModules:
                 console.print(f"📊 Generating {report_type} report...", style="cyan")
             
             # Determine time period
-            now = datetime.utcnow()
+            now = datetime.now(timezone.utc)
             if report_type == "daily":
                 since = now - timedelta(days=1)
                 title = f"Daily AI News Report - {now.strftime('%Y-%m-%d')}"
@@ -319,23 +339,27 @@ class AutomationModules:
                     'processing_time': time.time() - start_time
                 }
             
+            # Calculate report statistics and category breakdown in the database
+            in_period = Article.published_at >= since
+            is_analyzed = Article.processing_stage == 'analyzed'
+            with self._get_session() as session:
+                total_count, analyzed_count, avg_relevance, avg_quality = session.execute(
+                    select(
+                        func.count(Article.id),
+                        func.count(Article.id).filter(is_analyzed),
+                        func.avg(Article.relevance_score).filter(is_analyzed),
+                        func.avg(Article.quality_score).filter(is_analyzed)
+                    ).where(in_period)
+                ).one()
+                category_stats = self._count_categories(session, in_period)
+            stats = ReportStats(total_count, analyzed_count, float(avg_relevance or 0), float(avg_quality or 0))
+            avg_relevance = stats.avg_relevance
+            
             # Generate report content and statistics
             report_content = self.create_report_content(
-                title, recent_articles, top_articles, report_type
+                title, recent_articles, top_articles, report_type, stats, category_stats
             )
             
-            # Calculate report statistics
-            analyzed_articles = [a for a in recent_articles if a.processing_stage == 'analyzed']
-            avg_relevance = sum(a.relevance_score for a in analyzed_articles) / max(len(analyzed_articles), 1) if analyzed_articles else 0
-            avg_quality = sum(a.quality_score for a in analyzed_articles) / max(len(analyzed_articles), 1) if analyzed_articles else 0
-            
-            # Category breakdown
-            category_stats = {}
-            for article in analyzed_articles:
-                if article.categories:
-                    for cat in article.categories:
-                        category_stats[cat] = category_stats.get(cat, 0) + 1
-            
             # Key highlights
             key_highlights = []
             for article in top_articles[:5]:
@@ -353,16 +377,16 @@ class AutomationModules:
                     report_type=report_type,
                     report_date=now,
                     title=title,
-                    executive_summary=f"AI News {report_type} report covering {len(recent_articles)} articles with average relevance of {avg_relevance:.2f}",
+                    executive_summary=f"AI News {report_type} report covering {total_count} articles with average relevance of {avg_relevance:.2f}",
                     key_highlights=key_highlights,
                     category_breakdown=category_stats,
                     full_content=report_content,
                     generation_model="report-generator-v1",
                     generation_duration=time.time() - start_time,
                     status='published',
-                    article_count=len(recent_articles),
+                    article_count=total_count,
                     avg_relevance_score=avg_relevance,
-                    coverage_completeness=min(len(recent_articles) / 10, 1.0)  # Expect at least 10 articles
+                    coverage_completeness=min(total_count / 10, 1.0)  # Expect at least 10 articles
                 )
                 session.add(db_report)
                 session.flush()  # Get the ID
@@ -396,7 +420,7 @@ class AutomationModules:
             
             if verbose:
                 console.print(f"✅ Report generated: {report_file}", style="green")
-                console.print(f"📊 {len(recent_articles)} articles, {len(top_articles)} top articles", style="cyan")
+                console.print(f"📊 {total_count} articles, {len(top_articles)} top articles", style="cyan")
                 if report_id:
                     console.print(f"💾 Report saved to database with ID: {report_id}", style="cyan")
             
@@ -404,9 +428,11 @@ class AutomationModules:
                 'success': True,
                 'report_file': str(report_file),
                 'report_id': str(report_id) if report_id else None,
-                'articles_count': len(recent_articles),
+                'articles_count': total_count,
                 'top_articles_count': len(top_articles),
+                'analyzed_count': analyzed_count,
                 'avg_relevance': avg_relevance,
+                'avg_quality': stats.avg_quality,
                 'category_breakdown': category_stats,
                 'processing_time': processing_time
             }
@@ -525,18 +551,22 @@ class AutomationModules:
         """Get comprehensive system status."""
         try:
             with self._get_session() as session:
-                # Database statistics
-                total_articles = session.query(func.count(Article.id)).scalar()
-                analyzed_articles = session.query(func.count(Article.id)).filter(Article.processing_stage == 'analyzed').scalar()
-                recent_articles = session.query(func.count(Article.id)).filter(
-                    Article.published_at >= datetime.utcnow() - timedelta(hours=24)
-                ).scalar()
-                active_sources = session.query(func.count(NewsSource.id)).filter(NewsSource.active == True).scalar()
+                # Database statistics and average scores in one round-trip
+                is_analyzed = Article.processing_stage == 'analyzed'
+                active_sources_count = select(func.count(NewsSource.id))\
+                    .where(NewsSource.active == True)\
+                    .scalar_subquery()
                 
-                # Average scores
-                avg_relevance = session.query(func.avg(Article.relevance_score)).filter(
-                    Article.processing_stage == 'analyzed'
-                ).scalar() or 0.0
+                total_articles, analyzed_articles, recent_articles, avg_relevance, active_sources = session.execute(
+                    select(
+                        func.count(Article.id),
+                        func.count(Article.id).filter(is_analyzed),
+                        func.count(Article.id).filter(Article.published_at >= datetime.utcnow() - timedelta(hours=24)),
+                        func.avg(Article.relevance_score).filter(is_analyzed),
+                        active_sources_count
+                    )
+                ).one()
+                avg_relevance = avg_relevance or 0.0
                 
                 return {
                     'database_healthy': True,
@@ -581,18 +611,7 @@ class AutomationModules:
                 total_reports = session.query(func.count(Report.id)).scalar()
                 
                 # Category breakdown from analyzed articles
-                category_breakdown = {}
-                analyzed_articles = session.query(Article).filter(
-                    and_(
-                        Article.processing_stage == 'analyzed',
-                        Article.categories.isnot(None)
-                    )
-                ).all()
-                
-                for article in analyzed_articles:
-                    if article.categories:
-                        for category in article.categories:
-                            category_breakdown[category] = category_breakdown.get(category, 0) + 1
+                category_breakdown = self._count_categories(session)
                 
                 # Processing success rate (analyzed vs total processed attempts)
                 total_processed_attempts = session.query(func.count(Article.id)).filter(
@@ -635,7 +654,17 @@ class AutomationModules:
             logger.error(f"Failed to get analytics data: {e}")
             return {}
 
-    def _create_fallback_analysis(self, article: Article) -> Any:
+    def _count_categories(self, session, *criteria) -> Dict[str, int]:
+        """Count analyzed articles per category with a GROUP BY over the unnested array."""
+        categories = select(func.unnest(Article.categories).label('category'))\
+            .where(Article.processing_stage == 'analyzed', *criteria)\
+            .subquery()
+        rows = session.execute(
+            select(categories.c.category, func.count()).group_by(categories.c.category)
+        ).all()
+        return dict(rows)
+
+    def _create_fallback_analysis(self, article: Any) -> Any:
         """Create a simple fallback analysis when AI fails."""
         from types import SimpleNamespace
         import random
@@ -685,24 +714,30 @@ class AutomationModules:
         return analysis
     
     # Helper methods for database operations
-    def get_unanalyzed_articles(self, limit: int = None) -> List[Article]:
-        """Get unanalyzed articles."""
+    def get_unanalyzed_articles(self, limit: int = None) -> List[Row]:
+        """
+        Get unanalyzed articles.
+
+        Only the columns analysis reads (id, title, summary, content) are
+        selected and returned as a list of rows. Rows are plain tuples, so
+        nothing lazy-loads after the session closes; updates go back through
+        the article id.
+        """
         try:
             with self._get_session() as session:
-                query = session.query(Article)\
-                    .filter(or_(
+                query = select(Article.id, Article.title, Article.summary, Article.content)\
+                    .where(or_(
                         Article.processing_stage.is_(None), 
                         Article.processing_stage == 'discovered',
                         Article.processed == False
                     ))\
-                    .filter(Article.content.isnot(None))\
+                    .where(Article.content.isnot(None))\
                     .order_by(desc(Article.published_at))
                 
                 if limit:
                     query = query.limit(limit)
                 
-                articles = query.all()
-                return articles
+                return session.execute(query).all()
         except Exception as e:
             logger.error(f"Failed to get unanalyzed articles: {e}")
             return []
@@ -711,6 +746,89 @@ class AutomationModules:
         """Update article with analysis results."""
         return self.update_article_analysis_enhanced(article_id, analysis_data, 0.0)
     
+    def _analysis_values(self, analysis_data: Any, cost: float = 0.0) -> Dict[str, Any]:
+        """Map analysis results onto Article column values."""
+        values = {
+            'relevance_score': getattr(analysis_data, 'relevance_score', 0.0),
+            'quality_score': getattr(analysis_data, 'quality_score', 0.0),
+            'sentiment_score': getattr(analysis_data, 'sentiment_score', 0.0),
+            'urgency_score': getattr(analysis_data, 'urgency_score', 0.0),
+            'categories': None,
+            'entities': None,
+            'topics': None,
+            'keywords': None,
+        }
+        
+        # Store categories and topics
+        categories = []
+        if hasattr(analysis_data, 'primary_category') and analysis_data.primary_category:
+            categories.append(analysis_data.primary_category)
+        if hasattr(analysis_data, 'ai_domains') and analysis_data.ai_domains:
+            categories.extend(analysis_data.ai_domains)
+        if categories:
+            values['categories'] = categories
+        
+        # Store entities and topics
+        if hasattr(analysis_data, 'entities') and analysis_data.entities:
+            entities_dict = {
+                "companies": [],
+                "people": [],
+                "technologies": [],
+                "other": []
+            }
+            for entity in analysis_data.entities:
+                entity_type = getattr(entity, 'type', 'other').lower()
+                entity_text = getattr(entity, 'text', '')
+                if entity_text:
+                    if 'company' in entity_type or 'org' in entity_type:
+                        entities_dict["companies"].append(entity_text)
+                    elif 'person' in entity_type:
+                        entities_dict["people"].append(entity_text)
+                    elif 'tech' in entity_type or 'product' in entity_type:
+                        entities_dict["technologies"].append(entity_text)
+                    else:
+                        entities_dict["other"].append(entity_text)
+            values['entities'] = entities_dict
+        
+        if hasattr(analysis_data, 'topics') and analysis_data.topics:
+            values['topics'] = [getattr(t, 'name', str(t)) for t in analysis_data.topics]
+        
+        if hasattr(analysis_data, 'keywords') and analysis_data.keywords:
+            values['keywords'] = analysis_data.keywords[:20]  # Limit to 20 keywords
+        
+        # Mark as processed and analyzed
+        values['processed'] = True
+        values['processing_stage'] = 'analyzed'
+        values['analysis_timestamp'] = datetime.utcnow()
+        values['analysis_cost_usd'] = cost
+        values['analysis_model'] = "cohere-command-r"  # Or get from settings
+        return values
+
+    def _cost_record_values(self, article_id: Any, cost: float) -> Dict[str, Any]:
+        """Build a content-analysis CostTracking row."""
+        return {
+            'operation_type': 'content_analysis',
+            'operation_id': str(article_id),
+            'provider': 'cohere',
+            'model_name': 'command-r',
+            'total_cost_usd': cost,
+            'article_id': article_id,
+            'success': True
+        }
+
+    def _build_urgency_alert(self, article_id: Any, title: str, urgency_score: Optional[float]) -> Optional[Alert]:
+        """Create a breaking-news alert for high-urgency articles."""
+        if not urgency_score or urgency_score <= 0.8:
+            return None
+        return Alert(
+            title=f"Breaking: {(title or '')[:200]}",
+            message=f"High-urgency article detected with score {urgency_score:.2f}",
+            alert_type='breaking_news',
+            urgency_level='high' if urgency_score > 0.9 else 'medium',
+            urgency_score=urgency_score,
+            article_id=article_id
+        )
+
     def update_article_analysis_enhanced(self, article_id: int, analysis_data: Any, cost: float = 0.0) -> bool:
         """Update article with analysis results and track cost."""
         try:
@@ -719,79 +837,17 @@ class AutomationModules:
                 if not article:
                     return False
                 
-                # Update with analysis results
-                article.relevance_score = getattr(analysis_data, 'relevance_score', 0.0)
-                article.quality_score = getattr(analysis_data, 'quality_score', 0.0)
-                article.sentiment_score = getattr(analysis_data, 'sentiment_score', 0.0)
-                article.urgency_score = getattr(analysis_data, 'urgency_score', 0.0)
-                
-                # Store categories and topics
-                if hasattr(analysis_data, 'primary_category') and analysis_data.primary_category:
-                    article.categories = [analysis_data.primary_category]
-                if hasattr(analysis_data, 'ai_domains') and analysis_data.ai_domains:
-                    if article.categories:
-                        article.categories.extend(analysis_data.ai_domains)
-                    else:
-                        article.categories = analysis_data.ai_domains
-                
-                # Store entities and topics
-                if hasattr(analysis_data, 'entities') and analysis_data.entities:
-                    entities_dict = {
-                        "companies": [],
-                        "people": [],
-                        "technologies": [],
-                        "other": []
-                    }
-                    for entity in analysis_data.entities:
-                        entity_type = getattr(entity, 'type', 'other').lower()
-                        entity_text = getattr(entity, 'text', '')
-                        if entity_text:
-                            if 'company' in entity_type or 'org' in entity_type:
-                                entities_dict["companies"].append(entity_text)
-                            elif 'person' in entity_type:
-                                entities_dict["people"].append(entity_text)
-                            elif 'tech' in entity_type or 'product' in entity_type:
-                                entities_dict["technologies"].append(entity_text)
-                            else:
-                                entities_dict["other"].append(entity_text)
-                    article.entities = entities_dict
-                
-                if hasattr(analysis_data, 'topics') and analysis_data.topics:
-                    article.topics = [getattr(t, 'name', str(t)) for t in analysis_data.topics]
-                
-                if hasattr(analysis_data, 'keywords') and analysis_data.keywords:
-                    article.keywords = analysis_data.keywords[:20]  # Limit to 20 keywords
-                
-                # Mark as processed and analyzed
-                article.processed = True
-                article.processing_stage = 'analyzed'
-                article.analysis_timestamp = datetime.utcnow()
-                article.analysis_cost_usd = cost
-                article.analysis_model = "cohere-command-r"  # Or get from settings
+                for column, value in self._analysis_values(analysis_data, cost).items():
+                    if value is not None:
+                        setattr(article, column, value)
                 
                 # Create cost tracking record if cost > 0
                 if cost > 0:
-                    cost_record = CostTracking(
-                        operation_type='content_analysis',
-                        operation_id=str(article.id),
-                        provider='cohere',
-                        model_name='command-r',
-                        total_cost_usd=cost,
-                        article_id=article.id,
-                        success=True
-                    )
-                    session.add(cost_record)
+                    session.add(CostTracking(**self._cost_record_values(article.id, cost)))
                 
                 # Check for high-urgency articles and create alerts
-                if article.urgency_score > 0.8:
-                    alert = Alert(
-                        title=f"Breaking: {article.title[:200]}",
-                        message=f"High-urgency article detected with score {article.urgency_score:.2f}",
-                        alert_type='breaking_news',
-                        urgency_level='high' if article.urgency_score > 0.9 else 'medium',
-                        urgency_score=article.urgency_score,
-                        article_id=article.id
-                    )
+                alert = self._build_urgency_alert(article.id, article.title, article.urgency_score)
+                if alert is not None:
                     session.add(alert)
                 
                 session.commit()
@@ -800,6 +856,59 @@ class AutomationModules:
             logger.error(f"Failed to update article analysis: {e}")
             return False
 
+    def update_articles_analysis_batch(self, results: List[Tuple[Row, Any, float]]) -> bool:
+        """
+        Write a batch of analysis results in one transaction.
+        
+        Args:
+            results: (article row, analysis data, cost) tuples
+            
+        Returns:
+            True if the whole batch was committed
+        """
+        if not results:
+            return True
+        
+        articles = Article.__table__
+        # Columns without a result keep their stored value, so parameter sets
+        # are grouped by the columns they bind: one executemany UPDATE each
+        update_groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        cost_rows = []
+        alerts = []
+        for article, analysis_data, cost in results:
+            values = {
+                column: value
+                for column, value in self._analysis_values(analysis_data, cost).items()
+                if value is not None
+            }
+            update_groups.setdefault(tuple(values), []).append({'b_id': article.id, **values})
+            
+            if cost > 0:
+                cost_rows.append(self._cost_record_values(article.id, cost))
+            
+            alert = self._build_urgency_alert(article.id, article.title, values.get('urgency_score'))
+            if alert is not None:
+                alerts.append(alert)
+        
+        try:
+            with self._get_session() as session:
+                for columns, params in update_groups.items():
+                    stmt = update(articles)\
+                        .where(articles.c.id == bindparam('b_id'))\
+                        .values({column: bindparam(column) for column in columns})
+                    session.execute(stmt, params)
+                
+                if cost_rows:
+                    session.execute(insert(CostTracking), cost_rows)
+                if alerts:
+                    session.add_all(alerts)
+                
+                session.commit()
+                return True
+        except Exception as e:
+            logger.error(f"Failed to write analysis batch of {len(results)} articles: {e}")
+            return False
+
     def get_articles_since(self, since: datetime, limit: int = 100) -> List[Article]:
         """Get articles since given datetime."""
         try:
@@ -821,11 +930,17 @@ class AutomationModules:
             return []
 
     def get_top_articles_by_relevance(self, since: datetime, limit: int = 10) -> List[Article]:
-        """Get top articles by relevance."""
+        """Get top articles by relevance, loading only the columns reports display."""
         try:
             with self._get_session() as session:
                 articles = session.query(Article)\
-                    .options(selectinload(Article.source))\
+                    .options(
+                        load_only(
+                            Article.id, Article.source_id, Article.title, Article.url, Article.summary,
+                            Article.published_at, Article.relevance_score, Article.quality_score
+                        ),
+                        selectinload(Article.source)
+                    )\
                     .filter(Article.published_at >= since)\
                     .filter(Article.processing_stage == 'analyzed')\
                     .filter(Article.relevance_score > 0.5)\
@@ -842,33 +957,22 @@ class AutomationModules:
             logger.error(f"Failed to get top articles: {e}")
             return []
 
-    def create_report_content(self, title: str, articles: List[Article], top_articles: List[Article], report_type: str) -> str:
-        """Create report content."""
+    def create_report_content(self, title: str, articles: List[Article], top_articles: List[Article], report_type: str,
+                              stats: ReportStats, categories: Dict[str, int]) -> str:
+        """Create report content from period statistics and category counts computed in SQL."""
         now = datetime.utcnow()
         
-        # Calculate statistics
-        analyzed_articles = [a for a in articles if a.processing_stage == 'analyzed']
-        avg_relevance = sum(a.relevance_score for a in analyzed_articles) / max(len(analyzed_articles), 1) if analyzed_articles else 0
-        avg_quality = sum(a.quality_score for a in analyzed_articles) / max(len(analyzed_articles), 1) if analyzed_articles else 0
-        
-        # Count by category
-        categories = {}
-        for article in analyzed_articles:
-            if article.categories:
-                for category in article.categories:
-                    categories[category] = categories.get(category, 0) + 1
-        
         # Generate report
         report = f"""# 🤖 {title}
 
 Generated at: {now.strftime('%Y-%m-%d %H:%M:%S')} UTC
 
 ## 📊 Summary Statistics
-- **Total Articles**: {len(articles)}
-- **Analyzed Articles**: {len(analyzed_articles)}
-- **Analysis Completion**: {(len(analyzed_articles)/max(len(articles),1)*100):.1f}%
-- **Average Relevance Score**: {avg_relevance:.2f}
-- **Average Quality Score**: {avg_quality:.2f}
+- **Total Articles**: {stats.total_count}
+- **Analyzed Articles**: {stats.analyzed_count}
+- **Analysis Completion**: {(stats.analyzed_count/max(stats.total_count,1)*100):.1f}%
+- **Average Relevance Score**: {stats.avg_relevance:.2f}
+- **Average Quality Score**: {stats.avg_quality:.2f}
 
 ## 📂 Content Categories
 """
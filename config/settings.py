@@ -95,6 +95,9 @@ class Settings(BaseSettings):
     rss_max_concurrent: int = Field(default=5, ge=1, le=20)
     rss_timeout: int = Field(default=30, ge=5, le=120)
     
+    # Content analysis
+    analysis_max_concurrent: int = Field(default=8, ge=1, le=50, description="Max in-flight content analysis requests")
+    
     # Content filtering
     relevance_threshold: float = Field(default=0.7, ge=0.0, le=1.0)
     ai_keywords: List[str] = Field(default=[
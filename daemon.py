@@ -35,6 +35,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from config.settings import get_settings
 from utils.cost_tracking import CostTracker, ServiceType
+from utils.logging_queue import start_queue_logging, stop_queue_logging
 from agents.content_analysis.agent import get_content_analysis_service
 from mcp_servers.rss_aggregator import fetch_all_sources, BatchFetchRequest
 from database.models import Article, NewsSource
@@ -539,10 +540,15 @@ if __name__ == "__main__":
     Path("logs").mkdir(exist_ok=True)
     Path("reports").mkdir(exist_ok=True)
     
+    # Handler I/O runs on a background thread, off the event loop
+    start_queue_logging()
+    
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
         print("\n👋 Goodbye!")
     except Exception as e:
         print(f"❌ Fatal error: {e}")
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
+    finally:
+        stop_queue_logging()
\ No newline at end of file
@@ -9,11 +9,11 @@ import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Dict, Any
-from sqlalchemy import create_engine, select, and_, or_, desc, func
-from sqlalchemy.orm import sessionmaker, selectinload
+from sqlalchemy import select, and_, or_, desc, func
+from sqlalchemy.orm import selectinload
 
 from database.models import Article, NewsSource
-from config.settings import get_settings
+from database.session import get_session_factory
 from mcp_servers.rss_aggregator.schemas import RSSArticle
 
 logger = logging.getLogger(__name__)
@@ -22,18 +22,10 @@ logger = logging.getLogger(__name__)
 class DaemonDatabase:
     """Database operations for the automation daemon."""
     
-    _engine = None
-    _Session = None
-    
     @classmethod
     def _get_session(cls):
-        """Get database session, creating engine if needed."""
-        if cls._Session is None:
-            settings = get_settings()
-            db_url = settings.database_url.get_secret_value()
-            cls._engine = create_engine(db_url, echo=False)
-            cls._Session = sessionmaker(bind=cls._engine)
-        return cls._Session()
+        """Get database session from the shared connection pool."""
+        return get_session_factory()()
 
     @staticmethod
     def save_rss_articles(rss_articles: List[RSSArticle]) -> Dict[str, int]:
@@ -15,6 +15,7 @@ from .models import (
     DatabaseService,
     create_default_news_sources
 )
+from .session import get_engine, get_session_factory
 
 __all__ = [
     'Base',
@@ -27,5 +28,7 @@ __all__ = [
     'SystemMetrics',
     'CostTracking',
     'DatabaseService',
-    'create_default_news_sources'
+    'create_default_news_sources',
+    'get_engine',
+    'get_session_factory'
 ]
\ No newline at end of file
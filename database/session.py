@@ -0,0 +1,48 @@
+"""
+Shared database engine and session factory.
+
+One pooled engine per process, reused by the automation modules, the daemon
+and the RSS saver so every operation borrows a connection from the same pool
+instead of each component opening its own.
+"""
+
+from typing import Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+
+from config.settings import get_database_url, get_settings
+
+_engine: Optional[Engine] = None
+_session_factory: Optional[sessionmaker] = None
+
+
+def get_engine() -> Engine:
+    """Get the process-wide engine, creating it on first use."""
+    global _engine
+    if _engine is None:
+        settings = get_settings()
+        _engine = create_engine(
+            get_database_url(),
+            echo=False,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+            pool_pre_ping=True  # Validate connections before use
+        )
+    return _engine
+
+
+def get_session_factory() -> sessionmaker:
+    """
+    Get the session factory bound to the shared engine.
+
+    Objects stay loaded after commit so callers can read generated ids and
+    attributes without a refresh query.
+    """
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = sessionmaker(bind=get_engine(), expire_on_commit=False)
+    return _session_factory
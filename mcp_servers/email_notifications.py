@@ -129,11 +129,13 @@ class EmailService:
         # Create default templates if they don't exist
         self._create_default_templates(template_dir)
         
+        # Templates are written once at startup, so skip per-render mtime checks
         return Environment(
             loader=FileSystemLoader(str(template_dir)),
             autoescape=True,
             trim_blocks=True,
-            lstrip_blocks=True
+            lstrip_blocks=True,
+            auto_reload=False
         )
     
     def _create_default_templates(self, template_dir: Path):
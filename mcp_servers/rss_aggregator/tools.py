@@ -23,6 +23,14 @@ from pydantic import ValidationError
 
 from config.constants import DEFAULT_NEWS_SOURCES, AI_KEYWORDS
 from config.settings import get_settings
+
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    xxhash = None
+    HAS_XXHASH = False
+
 from .schemas import (
     RSSSourceConfig, 
     RSSArticle, 
@@ -395,7 +403,7 @@ async def save_article_to_database(article_data: dict, source_id: str) -> bool:
 # ============================================================================
 
 def generate_content_hash(content: str) -> str:
-    """Generate SHA-256 hash of content for deduplication"""
+    """Generate 128-bit xxh3 hash (blake2b fallback) of content for deduplication"""
     if not content:
         return ""
     
@@ -403,7 +411,10 @@ def generate_content_hash(content: str) -> str:
     normalized = content.strip().lower()
     normalized = ' '.join(normalized.split())  # Normalize whitespace
     
-    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+    data = normalized.encode('utf-8')
+    if HAS_XXHASH:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
 
 def calculate_relevance_score(article: RSSArticle, keywords: List[str] = None) -> float:
     """Calculate relevance score for an article based on AI keywords"""
@@ -62,7 +62,13 @@ def print_warning(message: str):
 class RSSWithDatabaseSaver:
     """RSS fetcher with database persistence."""
     
-    def __init__(self):
+    def __init__(self, engine=None):
+        """
+        Args:
+            engine: Optional shared SQLAlchemy engine; a private one is
+                created by setup_database() when omitted.
+        """
+        self.engine = engine
         self.Session = None
         self.source_name_to_id = {}
         
@@ -79,9 +85,10 @@ class RSSWithDatabaseSaver:
             # Create database URL using correct settings API
             db_url = settings.database_url.get_secret_value()
             
-            # Create engine and session
-            engine = create_engine(db_url, echo=False)
-            self.Session = sessionmaker(bind=engine)
+            # Create engine and session, reusing a shared engine when given
+            if self.engine is None:
+                self.engine = create_engine(db_url, echo=False)
+            self.Session = sessionmaker(bind=self.engine)
             
             # Load source mappings
             with self.Session() as session:
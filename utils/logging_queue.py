@@ -0,0 +1,52 @@
+"""
+Background logging utilities.
+
+Moves log handler I/O onto a listener thread so coroutines never block on
+stream or file writes.
+"""
+
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+_listener: Optional[QueueListener] = None
+
+
+def start_queue_logging(target: Optional[logging.Logger] = None) -> QueueListener:
+    """
+    Route a logger's records through a queue to its original handlers.
+
+    The logger's handlers are detached and served by a QueueListener thread;
+    the logger itself keeps a single non-blocking QueueHandler. Call once
+    after logging is configured. Repeated calls return the running listener.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    target = target or logging.getLogger()
+    handlers = list(target.handlers)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    for handler in handlers:
+        target.removeHandler(handler)
+    target.addHandler(QueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def stop_queue_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+__all__ = [
+    'start_queue_logging',
+    'stop_queue_logging',
+]
@@ -0,0 +1,16 @@
+"""
+Nanosecond clock helpers.
+
+Timestamps are kept as integer epoch nanoseconds from time.time_ns() and
+converted to naive UTC datetimes, matching the datetime.utcnow() values the
+models were built around, only when a datetime is needed.
+"""
+
+from datetime import datetime, timezone
+
+NANOSECONDS_PER_SECOND = 1_000_000_000
+
+
+def ns_to_utc_datetime(timestamp_ns: int) -> datetime:
+    """Convert integer epoch nanoseconds to a naive UTC datetime."""
+    return datetime.fromtimestamp(timestamp_ns / NANOSECONDS_PER_SECOND, timezone.utc).replace(tzinfo=None)